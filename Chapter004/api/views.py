@@ -27,7 +27,7 @@ def archer_detail(request, pk):
 
 @api_view(['GET'])
 def club_list(request):
-    clubs = Club.objects.all()
+    clubs = Club.objects.prefetch_related('memberships__archer')
     serializer = ClubSerializer(clubs, many=True)
 
     return Response(serializer.data)
@@ -2,6 +2,7 @@ import random
 from decimal import Decimal
 
 from django.core.management.base import BaseCommand
+from django.db.models import Q
 from django.contrib.auth.models import User
 from django.utils import lorem_ipsum
 from api.models import User, Archer, Club, Membership
@@ -35,9 +36,22 @@ class Command(BaseCommand):
             ),
         ]
 
-        # create archers & re-fetch from db
-        Archer.objects.bulk_create(archers)
-        archers = Archer.objects.all()
+        # create missing archers & re-fetch from db, matching on the full
+        # name so other archers sharing a surname are left alone
+        names = Q()
+        for archer in archers:
+            names |= Q(last_name=archer.last_name, first_name=archer.first_name)
+        existing = set(
+            Archer.objects.filter(names).values_list('last_name', 'first_name')
+        )
+        Archer.objects.bulk_create(
+            [
+                archer for archer in archers
+                if (archer.last_name, archer.first_name) not in existing
+            ],
+            batch_size=1000,
+        )
+        archers = Archer.objects.filter(names)
         
         # Create sample clubs
         clubs = [
@@ -68,16 +82,34 @@ class Command(BaseCommand):
             ),
         ]
         
-        # create clubs & re-fetch from db
-        Club.objects.bulk_create(clubs)
-        clubs = Club.objects.all()
+        # create missing clubs & re-fetch from db
+        names = [club.name for club in clubs]
+        existing = set(
+            Club.objects.filter(name__in=names).values_list('name', flat=True)
+        )
+        Club.objects.bulk_create(
+            [club for club in clubs if club.name not in existing],
+            batch_size=1000,
+        )
+        clubs = Club.objects.filter(name__in=names)
         
-        for archer in archers:
-           for club in clubs:
-               Membership.objects.create(
-                   archer=archer,
-                   club=club,
-                   start_date="2023-01-01",
-                   end_date="2023-12-31",
-               )
+        # Create memberships for every archer in every club
+        existing = set(
+            Membership.objects.filter(archer__in=archers, club__in=clubs)
+            .values_list('archer_id', 'club_id')
+        )
+        memberships = [
+            Membership(
+                archer=archer,
+                club=club,
+                start_date="2023-01-01",
+                end_date="2023-12-31",
+            )
+            for archer in archers
+            for club in clubs
+            if (archer.id, club.id) not in existing
+        ]
+
+        # create memberships in a single batched insert
+        Membership.objects.bulk_create(memberships, batch_size=1000)
 
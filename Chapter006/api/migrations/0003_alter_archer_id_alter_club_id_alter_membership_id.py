@@ -0,0 +1,29 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:19
+
+import api.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_alter_membership_club'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='archer',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='club',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='membership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:19
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_alter_archer_id_alter_club_id_alter_membership_id'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='archer',
+            options={'verbose_name': 'Archer', 'verbose_name_plural': 'Archers'},
+        ),
+    ]
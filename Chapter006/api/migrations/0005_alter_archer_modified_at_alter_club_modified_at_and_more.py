@@ -0,0 +1,28 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_alter_archer_options'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='archer',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='club',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='membership',
+            name='modified_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
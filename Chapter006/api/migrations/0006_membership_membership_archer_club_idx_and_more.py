@@ -0,0 +1,21 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_alter_archer_modified_at_alter_club_modified_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='membership',
+            index=models.Index(fields=['archer', 'club'], name='membership_archer_club_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='membership',
+            constraint=models.UniqueConstraint(fields=('club', 'archer'), name='membership_club_archer_unique'),
+        ),
+    ]
@@ -1,4 +1,4 @@
-import uuid
+from functools import cached_property
 
 from django.utils import timezone
 from django.db import models
@@ -7,18 +7,20 @@ from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django_extensions.db.fields import AutoSlugField
 
+from api.utils import uuidv7
+
 class User(AbstractUser):
     pass
 
 class BaseModel(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
-    modified_at = models.DateTimeField(auto_now=True)
+    modified_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         abstract = True
 
 class Archer(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     last_name = models.CharField(
         max_length=64,
         null=False,
@@ -66,24 +68,19 @@ class Archer(BaseModel):
     )
 
     class Meta:
-        ordering = ['last_name']
         verbose_name = _("Archer")
         verbose_name_plural = _("Archers")
 
-    def __str__(self):
-        s_middle_name = ""
+    @cached_property
+    def display_name(self):
         if self.middle_name:
-            s_middle_name = self.middle_name
-        return f"{self.last_name} {self.first_name} {s_middle_name}"
+            return f"{self.last_name} {self.first_name} {self.middle_name}"
+        return f"{self.last_name} {self.first_name}"
 
-    def __unicode__(self):
-        s_middle_name = ""
-        if self.middle_name:
-            s_middle_name = self.middle_name
-        return f"{self.last_name} {self.first_name} {s_middle_name}"
+    def __str__(self):
+        return self.display_name
 
 class Club(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -129,12 +126,8 @@ class Club(BaseModel):
     def __str__(self):
         return self.name
 
-    def __unicode__(self):
-        return self.name
-
 
 class Membership(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     club = models.ForeignKey(
         Club,
         on_delete=models.PROTECT,
@@ -168,6 +161,17 @@ class Membership(BaseModel):
         help_text=_("format: Y-m-d, not required"),
     )
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['club', 'archer'],
+                name='membership_club_archer_unique'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'club'], name='membership_archer_club_idx'),
+        ]
+
 # Extensions
 
 # class Category(BaseModel):
@@ -0,0 +1,21 @@
+import orjson
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    orjson serializes dicts, lists, UUIDs and datetimes in C; anything it
+    does not know (lazy translations, Decimals, ...) falls back to DRF's
+    own JSONEncoder.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=JSONEncoder().default)
@@ -19,7 +19,8 @@ class ArcherSerializer(serializers.ModelSerializer):
 
 class MembershipSerializer(serializers.ModelSerializer):
     # archer = ArcherSerializer(read_only=True)
-    archer = serializers.StringRelatedField(
+    archer = serializers.CharField(
+        source='archer_display',
         read_only=True
     )
 
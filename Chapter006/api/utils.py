@@ -0,0 +1,50 @@
+import os
+import threading
+import time
+import uuid
+
+# Random bytes are read from the OS in chunks and handed out in slices,
+# so generating a UUID does not cost one getrandom() call per id.
+_POOL_SIZE = 4096
+_pool = b''
+_pool_pos = 0
+_pool_lock = threading.Lock()
+
+
+def _reset_pool():
+    # A forked worker must never hand out the same bytes as its parent.
+    global _pool, _pool_pos
+    _pool = b''
+    _pool_pos = 0
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pool)
+
+
+def _random_bytes(n):
+    global _pool, _pool_pos
+    with _pool_lock:
+        if _pool_pos + n > len(_pool):
+            _pool = os.urandom(_POOL_SIZE)
+            _pool_pos = 0
+        chunk = _pool[_pool_pos:_pool_pos + n]
+        _pool_pos += n
+    return chunk
+
+
+def uuidv7():
+    """
+    Return a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits hold the unix timestamp in milliseconds, so new
+    primary keys are appended at the end of the index instead of being
+    scattered across it like uuid4 values.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+    value |= int.from_bytes(_random_bytes(10), 'big')
+    # version 7 in bits 76-79, RFC 4122 variant in bits 62-63
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
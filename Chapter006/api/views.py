@@ -1,4 +1,8 @@
 from django.shortcuts import get_object_or_404
+from django.db.models import CharField, Case, Count, Max, Prefetch, Value, When
+from django.db.models.functions import Concat
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from api.serializers import (
     ArcherSerializer,
     ClubSerializer,
@@ -6,23 +10,67 @@ from api.serializers import (
 )
 from api.models import (
     Archer,
-    Club
+    Club,
+    Membership,
 )
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from rest_framework import generics
+from rest_framework.pagination import LimitOffsetPagination
 
+class ArcherPagination(LimitOffsetPagination):
+    default_limit = 100
+
+def table_version(*models):
+    # Row count plus latest modified_at per table: an edit moves the
+    # timestamp and a delete changes the count.
+    parts = []
+    for model in models:
+        stats = model.objects.aggregate(count=Count('pk'), last=Max('modified_at'))
+        last = stats['last'].timestamp() if stats['last'] else 0
+        parts.append(f"{stats['count']}:{last}")
+    return '-'.join(parts)
+
+def archers_etag(request, *args, **kwargs):
+    return table_version(Archer)
+
+def clubs_etag(request, *args, **kwargs):
+    # club responses embed membership rows and archer names
+    return table_version(Club, Membership, Archer)
+
+@method_decorator(condition(etag_func=archers_etag), name='get')
 class ArcherListAPIView(generics.ListAPIView):
-    queryset = Archer.objects.all()
+    queryset = Archer.objects.order_by('last_name', 'id')
     serializer_class = ArcherSerializer
+    pagination_class = ArcherPagination
 
 class ArcherDetailAPIView(generics.RetrieveAPIView):
     queryset = Archer.objects.all()
     serializer_class = ArcherSerializer
     lookup_url_kwarg = 'archer_id'
 
+# Same text as str(archer), built by the database for each membership row
+ARCHER_DISPLAY = Concat(
+    'archer__last_name',
+    Value(' '),
+    'archer__first_name',
+    Case(
+        When(archer__middle_name__gt='', then=Concat(Value(' '), 'archer__middle_name')),
+        default=Value(''),
+    ),
+    output_field=CharField(),
+)
+
+@method_decorator(condition(etag_func=clubs_etag), name='get')
 class ClubListAPIView(generics.ListAPIView):
-    queryset = Club.objects.prefetch_related('memberships__archer')
+    queryset = Club.objects.prefetch_related(
+        Prefetch(
+            'memberships',
+            queryset=Membership.objects.annotate(
+                archer_display=ARCHER_DISPLAY,
+            ).only('id', 'created_at', 'modified_at', 'club'),
+        )
+    )
     serializer_class = ClubSerializer
 
 # @api_view(['GET'])
@@ -33,8 +81,9 @@ class ClubListAPIView(generics.ListAPIView):
 #     return Response(serializer.data)
 
 @api_view(['GET'])
+@condition(etag_func=archers_etag)
 def archer_info(request):
-    archers = Archer.objects.all()
+    archers = Archer.objects.order_by('last_name', 'id')
     serializer = ArcherInfoSerializer({
         'archers': archers,
         'count': len(archers),
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='membership',
+            name='club',
+            field=models.ForeignKey(help_text='format: required', on_delete=django.db.models.deletion.PROTECT, related_name='memberships', to='api.club', verbose_name='club of the member'),
+        ),
+    ]
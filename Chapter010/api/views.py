@@ -15,7 +15,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 
 class ArcherListCreateAPIView(generics.ListCreateAPIView):
-    queryset = Archer.objects.all()
+    queryset = Archer.objects.only(*ArcherSerializer.Meta.fields)
     serializer_class = ArcherSerializer
     # permission_classes = [IsAuthenticated]
 
@@ -32,7 +32,7 @@ class ClubListAPIView(generics.ListAPIView):
 
 class ArcherInfoAPIView(APIView):
     def get(self, request):
-        archers = Archer.objects.all()
+        archers = Archer.objects.only(*ArcherSerializer.Meta.fields)
         serializer = ArcherInfoSerializer({
             'archers': archers,
             'count': len(archers),
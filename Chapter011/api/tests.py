@@ -1,3 +1,49 @@
-from django.test import TestCase
+from django.test import TestCase, modify_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from api.models import Archer, Club, Membership, User
+
+
+# silk stores every request in the database, which would be counted too
+@modify_settings(MIDDLEWARE={'remove': 'silk.middleware.SilkyMiddleware'})
+class ClubListQueryTests(TestCase):
+    # one query each for the clubs, their memberships and the archers,
+    # however many clubs there are
+    QUERIES = 3
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='tester', password='test')
+        cls.archers = [
+            Archer.objects.create(last_name=name, first_name='Test', author=cls.user)
+            for name in ('Jansen', 'Smulders', 'Vanalles')
+        ]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def add_clubs(self, count):
+        for _ in range(count):
+            club = Club.objects.create(
+                name=f'Club {Club.objects.count()}',
+                author=self.user,
+            )
+            for archer in self.archers:
+                Membership.objects.create(club=club, archer=archer)
+
+    def get_clubs(self):
+        with self.assertNumQueries(self.QUERIES):
+            response = self.client.get(reverse('club-list'))
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_query_count_does_not_grow_with_clubs(self):
+        self.add_clubs(2)
+        self.assertEqual(len(self.get_clubs()), 2)
+
+        self.add_clubs(3)
+        clubs = self.get_clubs()
+        self.assertEqual(len(clubs), 5)
+        self.assertEqual(len(clubs[0]['memberships']), 3)
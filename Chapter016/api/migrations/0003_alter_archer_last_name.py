@@ -0,0 +1,18 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_alter_membership_club'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='archer',
+            name='last_name',
+            field=models.CharField(db_index=True, help_text='format: required, max-64', max_length=64, verbose_name='last name of archer'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+from django.db.models import Prefetch
+from django.db.models.constants import LOOKUP_SEP
+from rest_framework import serializers
+
+
+def build_prefetches(serializer_class):
+    """
+    Walk the fields of a serializer and return the lookups its related
+    fields need as a (select_related, prefetch_related) pair of tuples.
+
+    A nested many=True model serializer becomes a Prefetch whose queryset
+    joins the relations of that serializer in turn, so each level of
+    nesting costs a single query.
+    """
+    select, prefetch = _collect(serializer_class())
+    return tuple(select), tuple(prefetch)
+
+
+def _collect(serializer, prefix=''):
+    select, prefetch = [], []
+    for name, field in serializer.get_fields().items():
+        source = field.source or name
+        if source == '*' or '.' in source:
+            continue
+        lookup = prefix + source
+        if isinstance(field, serializers.ListSerializer):
+            prefetch.append(_prefetch(lookup, field.child))
+        elif isinstance(field, serializers.ManyRelatedField):
+            prefetch.append(lookup)
+        elif isinstance(field, serializers.BaseSerializer):
+            # forward relation rendered by a nested serializer
+            select.append(lookup)
+            nested_select, nested_prefetch = _collect(field, lookup + LOOKUP_SEP)
+            select.extend(nested_select)
+            prefetch.extend(nested_prefetch)
+        elif isinstance(field, serializers.RelatedField) and not isinstance(
+            field, serializers.PrimaryKeyRelatedField
+        ):
+            # e.g. StringRelatedField needs the related object, not only its pk
+            select.append(lookup)
+    return select, prefetch
+
+
+def _prefetch(lookup, serializer):
+    model = getattr(getattr(serializer, 'Meta', None), 'model', None)
+    if model is None:
+        return lookup
+    queryset = _apply(model._default_manager.all(), *_collect(serializer))
+    return Prefetch(lookup, queryset=queryset)
+
+
+def _apply(queryset, select, prefetch):
+    # an empty select_related() would follow every foreign key
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
+
+
+class AutoPrefetchMixin:
+    """
+    Apply the select_related/prefetch_related lookups required by the
+    view's serializer. The serializer is introspected once per view class.
+    """
+
+    def get_queryset(self):
+        cls = type(self)
+        if '_prefetch' not in cls.__dict__:
+            cls._select, cls._prefetch = build_prefetches(
+                self.get_serializer_class()
+            )
+        return _apply(super().get_queryset(), cls._select, cls._prefetch)
@@ -24,6 +24,7 @@ class Archer(BaseModel):
         null=False,
         unique=False,
         blank=False,
+        db_index=True,
         verbose_name=_("last name of archer"),
         help_text=_("format: required, max-64")
     )
@@ -18,6 +18,7 @@ from rest_framework.permissions import (
 )
 from rest_framework.views import APIView
 from api.filters import ArcherFilter
+from api.mixins import AutoPrefetchMixin
 
 class ArcherListCreateAPIView(generics.ListCreateAPIView):
     queryset = Archer.objects.all()
@@ -41,14 +42,14 @@ class ArcherDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
             self.permission_classes = [IsAdminUser]
         return super().get_permissions()
 
-class ClubListAPIView(generics.ListAPIView):
-    queryset = Club.objects.prefetch_related('memberships__archer')
+class ClubListAPIView(AutoPrefetchMixin, generics.ListAPIView):
+    queryset = Club.objects.all()
     serializer_class = ClubSerializer
     permission_classes = [IsAuthenticated]
 
 class ArcherInfoAPIView(APIView):
     def get(self, request):
-        archers = Archer.objects.all()
+        archers = Archer.objects.only(*ArcherSerializer.Meta.fields)
         serializer = ArcherInfoSerializer({
             'archers': archers,
             'count': len(archers),
@@ -0,0 +1,8 @@
+from rest_framework.pagination import CursorPagination
+
+
+class ArcherCursorPagination(CursorPagination):
+    ordering = 'pk'
+    page_size = 2
+    page_size_query_param = 'size'
+    max_page_size = 6
@@ -1,21 +1,49 @@
+from django.core.cache import cache
+from django.db.models import Count, Max
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from django_filters.rest_framework import DjangoFilterBackend  # type: ignore
 from rest_framework import filters, generics, viewsets
 from rest_framework.decorators import api_view
-from rest_framework.pagination import (LimitOffsetPagination,
-                                       PageNumberPagination)
 from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from api.filters import ArcherFilter, ClubFilter
+from api.mixins import AutoPrefetchMixin
 from api.models import Archer, Club
+from api.pagination import ArcherCursorPagination
 from api.serializers import (ArcherInfoSerializer, ArcherSerializer,
                              ClubSerializer)
 
 
+def archer_etag(request, archer_id):
+    modified_at = (
+        Archer.objects.filter(pk=archer_id)
+        .values_list('modified_at', flat=True)
+        .first()
+    )
+    return str(modified_at.timestamp()) if modified_at else None
+
+def club_etag(request, pk):
+    # the club body embeds its memberships and their archer names
+    stats = Club.objects.filter(pk=pk).aggregate(
+        members=Count('memberships'),
+        club=Max('modified_at'),
+        membership=Max('memberships__modified_at'),
+        archer=Max('memberships__archer__modified_at'),
+    )
+    if stats['club'] is None:
+        return None
+    parts = [stats['members']] + [
+        stats[key].timestamp() if stats[key] else 0
+        for key in ('club', 'membership', 'archer')
+    ]
+    return ':'.join(map(str, parts))
+
 class ArcherListCreateAPIView(generics.ListCreateAPIView):
-    queryset = Archer.objects.order_by('pk')
+    queryset = Archer.objects.only(*ArcherSerializer.Meta.fields).order_by('pk')
     serializer_class = ArcherSerializer
     filterset_class = ArcherFilter
     filter_backends = [
@@ -26,31 +54,39 @@ class ArcherListCreateAPIView(generics.ListCreateAPIView):
     # Exact match: '=first_name', '=last_name'
     search_fields = ['first_name', 'last_name', 'info']
     ordering_fields = ['first_name', 'last_name']
-    pagination_class = PageNumberPagination
-    pagination_class.page_size = 2
-    pagination_class.page_query_param = 'pagenum'
-    pagination_class.page_size_query_param = 'size'
-    pagination_class.max_page_size = 6
+    pagination_class = ArcherCursorPagination
+
+    permission_classes_by_method = {
+        'POST': [IsAdminUser],
+    }
 
     def get_permissions(self):
-        self.permission_classes = [AllowAny]
-        if self.request.method == 'POST':
-            self.permission_classes = [IsAdminUser]
-        return super().get_permissions()
+        permission_classes = self.permission_classes_by_method.get(
+            self.request.method, [AllowAny]
+        )
+        return [permission() for permission in permission_classes]
 
+@method_decorator(condition(etag_func=archer_etag), name='get')
 class ArcherDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
     queryset = Archer.objects.all()
     serializer_class = ArcherSerializer
     lookup_url_kwarg = 'archer_id'
 
+    permission_classes_by_method = {
+        'PUT': [IsAdminUser],
+        'PATCH': [IsAdminUser],
+        'DELETE': [IsAdminUser],
+    }
+
     def get_permissions(self):
-        self.permission_classes = [AllowAny]
-        if self.request.method in ['PUT', 'PATCH', 'DELETE']:
-            self.permission_classes = [IsAdminUser]
-        return super().get_permissions()
+        permission_classes = self.permission_classes_by_method.get(
+            self.request.method, [AllowAny]
+        )
+        return [permission() for permission in permission_classes]
 
-class ClubViewSet(viewsets.ModelViewSet):
-    queryset = Club.objects.prefetch_related('memberships__archer').order_by('name')
+@method_decorator(condition(etag_func=club_etag), name='retrieve')
+class ClubViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
+    queryset = Club.objects.order_by('name')
     serializer_class = ClubSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = None
@@ -61,10 +97,23 @@ class ClubViewSet(viewsets.ModelViewSet):
 
 class ArcherInfoAPIView(APIView):
     def get(self, request):
-        archers = Archer.objects.all()
+        # any insert, update or delete changes the key, so cached
+        # payloads never outlive the rows they were built from
+        version = Archer.objects.aggregate(
+            count=Count('pk'), modified=Max('modified_at')
+        )
+        modified = version['modified']
+        key = 'archer-info:{}:{}'.format(
+            version['count'], modified.isoformat() if modified else ''
+        )
+        return Response(cache.get_or_set(key, self.build_info, 300))
+
+    @staticmethod
+    def build_info():
+        archers = Archer.objects.only(*ArcherSerializer.Meta.fields)
         serializer = ArcherInfoSerializer({
             'archers': archers,
             'count': len(archers),
         })
-        return Response(serializer.data)
+        return serializer.data
 
@@ -21,7 +21,7 @@ class MembershipSerializer(serializers.ModelSerializer):
     # archer = serializers.StringRelatedField(
     #     read_only=True
     # )
-    archer = serializers.StringRelatedField()
+    archer = serializers.SerializerMethodField()
 
     class Meta:
         model = Membership
@@ -32,6 +32,12 @@ class MembershipSerializer(serializers.ModelSerializer):
             'archer',
         )
 
+    def get_archer(self, obj) -> str:
+        # ClubViewSet annotates archer_display in SQL. Memberships read
+        # without it, e.g. when the response is rebuilt after an update,
+        # fall back to the archer itself.
+        return getattr(obj, 'archer_display', None) or str(obj.archer)
+
 class ClubCreateSerializer(serializers.ModelSerializer):
     class MembershipSerializer(serializers.ModelSerializer):
         class Meta:
@@ -46,8 +52,10 @@ class ClubCreateSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         membership_data = validated_data.pop('memberships')
         club = Club.objects.create(**validated_data)
-        for membership in membership_data:
-            Membership.objects.create(club=club, **membership)
+        Membership.objects.bulk_create(
+            [Membership(club=club, **membership) for membership in membership_data],
+            batch_size=500,
+        )
 
         return club
 
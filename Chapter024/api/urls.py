@@ -1,7 +1,7 @@
 import uuid
 from django.urls import path
 from . import views
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 urlpatterns = [
     path('archers/', views.ArcherListCreateAPIView.as_view(), name='archer-list'),
@@ -10,7 +10,7 @@ urlpatterns = [
     # path('clubs/', views.ClubListAPIView.as_view(), name='club-list'),
 ]
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register(r'clubs', views.ClubViewSet, basename='club')
 urlpatterns += router.urls
 
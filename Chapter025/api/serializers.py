@@ -32,7 +32,7 @@ class MembershipSerializer(serializers.ModelSerializer):
     # archer = serializers.StringRelatedField(
     #     read_only=True
     # )
-    archer = serializers.StringRelatedField()
+    archer = serializers.SerializerMethodField()
 
     class Meta:
         model = Membership
@@ -43,6 +43,12 @@ class MembershipSerializer(serializers.ModelSerializer):
             'archer',
         )
 
+    def get_archer(self, obj) -> str:
+        # ClubViewSet annotates archer_display in SQL. Memberships read
+        # without it, e.g. when the response is rebuilt after an update,
+        # fall back to the archer itself.
+        return getattr(obj, 'archer_display', None) or str(obj.archer)
+
 class ClubCreateSerializer(serializers.ModelSerializer):
     class MembershipSerializer(serializers.ModelSerializer):
         class Meta:
@@ -62,8 +68,13 @@ class ClubCreateSerializer(serializers.ModelSerializer):
 
             if membership_data is not None:
                 instance.memberships.all().delete()
-                for membership in membership_data:
-                    Membership.objects.create(club=instance, **membership)
+                Membership.objects.bulk_create(
+                    [
+                        Membership(club=instance, **membership)
+                        for membership in membership_data
+                    ],
+                    batch_size=500,
+                )
 
         return instance
 
@@ -72,8 +83,10 @@ class ClubCreateSerializer(serializers.ModelSerializer):
 
         with transaction.atomic():
             club = Club.objects.create(**validated_data)
-            for membership in membership_data:
-                Membership.objects.create(club=club, **membership)
+            Membership.objects.bulk_create(
+                [Membership(club=club, **membership) for membership in membership_data],
+                batch_size=500,
+            )
 
         return club
 
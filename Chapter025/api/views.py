@@ -1,3 +1,5 @@
+from django.db.models import CharField, Prefetch, Value
+from django.db.models.functions import Coalesce, Concat
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend  # type: ignore
 from rest_framework import filters, generics, viewsets
@@ -9,7 +11,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from api.filters import ArcherFilter, ClubFilter
-from api.models import Archer, Club, User
+from api.models import Archer, Club, Membership, User
 from api.serializers import (ArcherInfoSerializer, ArcherSerializer,
                              ClubSerializer, ClubCreateSerializer,
                              UserSerializer)
@@ -49,8 +51,23 @@ class ArcherDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
             self.permission_classes = [IsAdminUser]
         return super().get_permissions()
 
+# Same text as Archer.__str__, built by the database for each membership
+ARCHER_DISPLAY = Concat(
+    'archer__last_name',
+    Value(' '),
+    'archer__first_name',
+    Value(' '),
+    Coalesce('archer__middle_name', Value('')),
+    output_field=CharField(),
+)
+
 class ClubViewSet(viewsets.ModelViewSet):
-    queryset = Club.objects.prefetch_related('memberships__archer').order_by('name')
+    queryset = Club.objects.prefetch_related(
+        Prefetch(
+            'memberships',
+            queryset=Membership.objects.annotate(archer_display=ARCHER_DISPLAY),
+        )
+    ).order_by('name')
     serializer_class = ClubSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = None
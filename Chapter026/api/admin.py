@@ -65,6 +65,8 @@ class MembershipAdmin(admin.ModelAdmin):
     list_display = ('archer', 'club', 'start_date', 'end_date')
     list_display_links = ('archer',)
     list_per_page = 20
+    list_select_related = ('archer', 'club')
+    raw_id_fields = ('archer',)
     ordering = ('archer', 'club')
     fieldsets = (
         (None, {
@@ -73,32 +75,37 @@ class MembershipAdmin(admin.ModelAdmin):
     )
     search_fields = ('archer__last_name', 'club__name')
 
+class NameAdmin(admin.ModelAdmin):
+    list_display = ('name',)
+    list_display_links = ('name',)
+    list_per_page = 20
+    ordering = ('name',)
+    search_fields = ('name',)
+
 class CategoryMembershipInline(admin.TabularInline):
     model = CategoryMembership
     extra = 1
+    raw_id_fields = ('archer',)
     fields = ('archer', 'category')
     can_delete = False
     show_change_link = True
 
-class CategoryAdmin(admin.ModelAdmin):
+class CategoryAdmin(NameAdmin):
     inlines = [
         CategoryMembershipInline
     ]
-    list_display = ('name',)
-    list_display_links = ('name',)
-    list_per_page = 20
-    ordering = ('name',)
     fieldsets = (
         (None, {
             'fields': ('name',)
         }),
     )
-    search_fields = ('name',)
 
 class CategoryMembershipAdmin(admin.ModelAdmin):
     list_display = ('archer', 'category')
     list_display_links = ('archer',)
     list_per_page = 20
+    list_select_related = ('archer', 'category')
+    raw_id_fields = ('archer',)
     ordering = ('archer', 'category')
     fieldsets = (
         (None, {
@@ -110,29 +117,27 @@ class CategoryMembershipAdmin(admin.ModelAdmin):
 class BowtypeMembershipInline(admin.TabularInline):
     model = BowTypeMembership
     extra = 1
+    raw_id_fields = ('archer',)
     fields = ('archer', 'bowtype')
     can_delete = False
     show_change_link = True
 
-class BowtypeAdmin(admin.ModelAdmin):
+class BowtypeAdmin(NameAdmin):
     inlines = [
         BowtypeMembershipInline
     ]
-    list_display = ('name',)
-    list_display_links = ('name',)
-    list_per_page = 20
-    ordering = ('name',)
     fieldsets = (
         (None, {
             'fields': ('name', 'info')
         }),
     )
-    search_fields = ('name',)
 
 class BowTypeMembershipAdmin(admin.ModelAdmin):
     list_display = ('archer', 'bowtype')
     list_display_links = ('archer',)
     list_per_page = 20
+    list_select_related = ('archer', 'bowtype')
+    raw_id_fields = ('archer',)
     ordering = ('archer', 'bowtype')
     fieldsets = (
         (None, {
@@ -144,29 +149,27 @@ class BowTypeMembershipAdmin(admin.ModelAdmin):
 class TeamMembershipInline(admin.TabularInline):
     model = TeamMembership
     extra = 1
+    raw_id_fields = ('archer',)
     fields = ('archer', 'team')
     can_delete = False
     show_change_link = True
 
-class TeamAdmin(admin.ModelAdmin):
+class TeamAdmin(NameAdmin):
     inlines = [
         TeamMembershipInline
     ]
-    list_display = ('name',)
-    list_display_links = ('name',)
-    list_per_page = 20
-    ordering = ('name',)
     fieldsets = (
         (None, {
             'fields': ('name',)
         }),
     )
-    search_fields = ('name',)
     
 class TeamMembershipAdmin(admin.ModelAdmin):
     list_display = ('archer', 'team')
     list_display_links = ('archer',)
     list_per_page = 20
+    list_select_related = ('archer', 'team')
+    raw_id_fields = ('archer',)
     ordering = ('archer', 'team')
     fieldsets = (
         (None, {
@@ -178,29 +181,28 @@ class TeamMembershipAdmin(admin.ModelAdmin):
 class ContestMembershipInline(admin.TabularInline):
     model = ContestMembership
     extra = 1
+    raw_id_fields = ('archer',)
     fields = ('archer', 'contest')
     can_delete = False
     show_change_link = True
 
-class ContestAdmin(admin.ModelAdmin):
+class ContestAdmin(NameAdmin):
     inlines = [
         ContestMembershipInline
     ]
     list_display = ('name', 'start_date', 'start_time')
-    list_display_links = ('name',)
-    list_per_page = 20
-    ordering = ('name',)
     fieldsets = (
         (None, {
             'fields': ('name', 'start_date', 'start_time', 'info')
         }),
     )
-    search_fields = ('name',)
 
 class ContestMembershipAdmin(admin.ModelAdmin):
     list_display = ('archer', 'contest')
     list_display_links = ('archer',)
     list_per_page = 20
+    list_select_related = ('archer', 'contest')
+    raw_id_fields = ('archer',)
     ordering = ('archer', 'contest')
     fieldsets = (
         (None, {
@@ -209,34 +211,27 @@ class ContestMembershipAdmin(admin.ModelAdmin):
     )
     search_fields = ('archer__last_name', 'contest__name')
 
-class TargetFaceAdmin(admin.ModelAdmin):
+class TargetFaceAdmin(NameAdmin):
     list_display = ('name', 'diameter')
-    list_display_links = ('name',)
-    list_per_page = 20
-    ordering = ('name',)
     fieldsets = (
         (None, {
             'fields': ('name', 'diameter', 'info') 
         }),
     )
-    search_fields = ('name',)
 
-class ScoringSheetAdmin(admin.ModelAdmin):
-    list_display = ('name',)
-    list_display_links = ('name',)
-    list_per_page = 20
-    ordering = ('name',)
+class ScoringSheetAdmin(NameAdmin):
     fieldsets = (
         (None, {
             'fields': ('name', 'info')
         }),
     )
-    search_fields = ('name',)
 
 class ResultAdmin(admin.ModelAdmin):
     list_display = ('contest', 'archer', 'score')
     list_display_links = ('contest',)
     list_per_page = 20
+    list_select_related = ('contest', 'archer')
+    raw_id_fields = ('archer',)
     ordering = ('contest', 'archer')
     fieldsets = (
         (None, {
@@ -248,29 +243,27 @@ class ResultAdmin(admin.ModelAdmin):
 class CompetitionMembershipInline(admin.TabularInline):
     model = CompetitionMembership
     extra = 1
+    raw_id_fields = ('archer',)
     fields = ('archer', 'competition')
     can_delete = False
     show_change_link = True
 
-class CompetitionAdmin(admin.ModelAdmin):
+class CompetitionAdmin(NameAdmin):
     inlines = [
         CompetitionMembershipInline
     ]
-    list_display = ('name',)
-    list_display_links = ('name',)
-    list_per_page = 20
-    ordering = ('name',)
     fieldsets = (
         (None, {
             'fields': ('name', 'info')
         }),
     )
-    search_fields = ('name',)
 
 class CompetitionMembershipAdmin(admin.ModelAdmin):
     list_display = ('archer', 'competition')
     list_display_links = ('archer',)
     list_per_page = 20
+    list_select_related = ('archer', 'competition')
+    raw_id_fields = ('archer',)
     ordering = ('archer', 'competition')
     fieldsets = (
         (None, {
@@ -0,0 +1,41 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0031_alter_accessory_id_alter_archer_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='archer',
+            index=models.Index(fields=['last_name', 'first_name'], name='archer_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bowtypemembership',
+            index=models.Index(fields=['archer', 'bowtype'], name='btmember_archer_bowtype_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='categorymembership',
+            index=models.Index(fields=['archer', 'category'], name='catmember_archer_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='membership',
+            index=models.Index(fields=['archer', 'club'], name='membership_archer_club_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='bowtypemembership',
+            constraint=models.UniqueConstraint(fields=('bowtype', 'archer'), name='bowtypemembership_bowtype_archer_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='categorymembership',
+            constraint=models.UniqueConstraint(fields=('category', 'archer'), name='categorymembership_category_archer_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='membership',
+            constraint=models.UniqueConstraint(fields=('club', 'archer'), name='membership_club_archer_unique'),
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0032_archer_archer_name_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='bowlimb',
+            name='draw_length',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='bowlimb draw length in inches'),
+        ),
+        migrations.AlterField(
+            model_name='bowlimb',
+            name='draw_weight',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='bowlimb draw weight in pounds'),
+        ),
+        migrations.AlterField(
+            model_name='bowlimb',
+            name='length',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='bowlimb length in inches'),
+        ),
+        migrations.AlterField(
+            model_name='bowlimb',
+            name='limb_weight',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='bowlimb weight in pounds'),
+        ),
+        migrations.AlterField(
+            model_name='bowlimb',
+            name='tension',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='bowlimb tension in pounds'),
+        ),
+        migrations.AlterField(
+            model_name='bowriser',
+            name='length',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='bowriser length in inches'),
+        ),
+        migrations.AlterField(
+            model_name='bowstring',
+            name='length',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='bowstring length in inches'),
+        ),
+        migrations.AlterField(
+            model_name='bowtype',
+            name='length',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='bow length in inches'),
+        ),
+        migrations.AlterField(
+            model_name='bowtype',
+            name='max_draw_length',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='maximum draw length in inches'),
+        ),
+        migrations.AlterField(
+            model_name='bowtype',
+            name='max_draw_weight',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='maximum draw weight'),
+        ),
+        migrations.AlterField(
+            model_name='bowtype',
+            name='min_draw_length',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='minimum draw length in inches'),
+        ),
+        migrations.AlterField(
+            model_name='bowtype',
+            name='min_draw_weight',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='minimum draw weight'),
+        ),
+    ]
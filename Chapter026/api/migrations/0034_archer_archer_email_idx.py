@@ -0,0 +1,17 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0033_alter_bowlimb_draw_length_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='archer',
+            index=models.Index(condition=models.Q(('email__isnull', False)), fields=['email'], name='archer_email_idx'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.1.1 on 2026-10-15 23:10
+
+from django.db import migrations, models
+
+
+MEMBERSHIPS = (
+    ('team', 'teammembership'),
+    ('contest', 'contestmembership'),
+    ('competition', 'competitionmembership'),
+)
+
+
+def copy_archers_to_memberships(apps, schema_editor):
+    # Rows of the implicit <model>_archer tables that have no membership
+    # yet are moved into the membership model before the table is dropped.
+    for model_name, membership_name in MEMBERSHIPS:
+        model = apps.get_model('api', model_name)
+        membership = apps.get_model('api', membership_name)
+        through = model._meta.get_field('archer').remote_field.through
+        owner_id = model_name + '_id'
+        existing = set(membership.objects.values_list(owner_id, 'archer_id'))
+        membership.objects.bulk_create(
+            [
+                membership(**{owner_id: owner, 'archer_id': archer})
+                for owner, archer in through.objects.values_list(owner_id, 'archer_id')
+                if (owner, archer) not in existing
+            ],
+            batch_size=500,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0034_archer_archer_email_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(copy_archers_to_memberships, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='team',
+            name='archer',
+        ),
+        migrations.RemoveField(
+            model_name='contest',
+            name='archer',
+        ),
+        migrations.RemoveField(
+            model_name='competition',
+            name='archer',
+        ),
+        migrations.AddField(
+            model_name='team',
+            name='archer',
+            field=models.ManyToManyField(blank=True, help_text='format: not required', related_name='teams', through='api.TeamMembership', to='api.archer'),
+        ),
+        migrations.AddField(
+            model_name='contest',
+            name='archer',
+            field=models.ManyToManyField(blank=True, help_text='format: not required', related_name='contests', through='api.ContestMembership', to='api.archer'),
+        ),
+        migrations.AddField(
+            model_name='competition',
+            name='archer',
+            field=models.ManyToManyField(blank=True, help_text='format: not required', related_name='competitions', through='api.CompetitionMembership', to='api.archer'),
+        ),
+    ]
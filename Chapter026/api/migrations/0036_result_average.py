@@ -0,0 +1,21 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:39
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+import django.db.models.functions.math
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0035_team_contest_competition_archer_through'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='result',
+            name='average',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.math.Round(django.db.models.expressions.CombinedExpression(django.db.models.functions.comparison.Cast(django.db.models.functions.comparison.NullIf('score', 0), models.FloatField()), '/', django.db.models.functions.comparison.NullIf('arrows', 0)), 2), output_field=models.FloatField(), verbose_name='average points per arrow'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0036_result_average'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='competitionmembership',
+            index=models.Index(fields=['archer', 'competition'], name='compmember_archer_comp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contestmembership',
+            index=models.Index(fields=['archer', 'contest'], name='ctmember_archer_contest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='result',
+            index=models.Index(fields=['contest', '-score'], name='result_contest_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='result',
+            index=models.Index(fields=['archer', 'contest'], name='result_archer_contest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teammembership',
+            index=models.Index(fields=['archer', 'team'], name='teammember_archer_team_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='competitionmembership',
+            constraint=models.UniqueConstraint(fields=('competition', 'archer'), name='competitionmembership_competition_archer_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='contestmembership',
+            constraint=models.UniqueConstraint(fields=('contest', 'archer'), name='contestmembership_contest_archer_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='teammembership',
+            constraint=models.UniqueConstraint(fields=('team', 'archer'), name='teammembership_team_archer_unique'),
+        ),
+    ]
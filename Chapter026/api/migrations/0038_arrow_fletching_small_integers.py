@@ -0,0 +1,72 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0037_membership_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='arrow',
+            name='diameter',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='arrow diameter in mm'),
+        ),
+        migrations.AlterField(
+            model_name='arrow',
+            name='length',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='arrow length in inches'),
+        ),
+        migrations.AlterField(
+            model_name='arrow',
+            name='spine',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='arrow spine'),
+        ),
+        migrations.AlterField(
+            model_name='arrow',
+            name='weight',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='arrow weight in grains'),
+        ),
+        migrations.AlterField(
+            model_name='fletching',
+            name='angle',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='fletching angle in degrees'),
+        ),
+        migrations.AlterField(
+            model_name='fletching',
+            name='height',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='fletching height in inches'),
+        ),
+        migrations.AlterField(
+            model_name='fletching',
+            name='length',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='fletching length in inches'),
+        ),
+        migrations.AlterField(
+            model_name='fletching',
+            name='position',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='fletching position in inches'),
+        ),
+        migrations.AlterField(
+            model_name='fletching',
+            name='thickness',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='fletching thickness in mm'),
+        ),
+        migrations.AlterField(
+            model_name='fletching',
+            name='weight',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='fletching weight in grains'),
+        ),
+        migrations.AlterField(
+            model_name='fletching',
+            name='width',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='format: not required', null=True, verbose_name='fletching width in inches'),
+        ),
+        migrations.AddConstraint(
+            model_name='fletching',
+            constraint=models.CheckConstraint(condition=models.Q(('angle__lte', 360)), name='fletching_angle_lte_360'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:42
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0038_arrow_fletching_small_integers'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='result',
+            name='slug',
+        ),
+    ]
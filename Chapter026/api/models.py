@@ -1,12 +1,18 @@
-import uuid
+from functools import cached_property
 
 from django.utils import timezone
 from django.db import models
+from django.db.models import Count, F, Prefetch, Q, Sum
+# functions.Round is used through its module, the Round model below shadows the name.
+from django.db.models import functions
+from django.db.models.functions import Cast, NullIf
 from django.contrib.auth.models import AbstractUser
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django_extensions.db.fields import AutoSlugField
 
+from api.utils import uuidv7
+
 class User(AbstractUser):
     """
     Custom user model that extends the default Django user model.
@@ -54,6 +60,56 @@ class BaseModel(models.Model):
 
         abstract = True
 
+class SelectRelatedManager(models.Manager):
+    """
+    Manager that joins the given foreign keys on every query.
+    Used by models whose string representation follows those keys,
+    so listing them does not cost one query per row and relation.
+    Subclasses name the keys in related. They are class attributes because
+    Django builds reverse and related managers by subclassing the default
+    manager and instantiating it without arguments.
+    """
+
+    related = ()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # an empty select_related() would follow every foreign key
+        if self.related:
+            queryset = queryset.select_related(*self.related)
+        return queryset
+
+class MembershipManager(SelectRelatedManager):
+    related = ('club', 'archer')
+
+class CategoryMembershipManager(SelectRelatedManager):
+    related = ('category', 'archer')
+
+class BowTypeMembershipManager(SelectRelatedManager):
+    related = ('bowtype', 'archer')
+
+class ArcherQuerySet(models.QuerySet):
+    """
+    QuerySet for the Archer model.
+    api_list() returns plain dict rows for read-only listings,
+    so no Archer instance is built for each row.
+    """
+
+    API_LIST_FIELDS = (
+        'id',
+        'created_at',
+        'modified_at',
+        'last_name',
+        'first_name',
+        'middle_name',
+        'union_number',
+        'info',
+        'author',
+    )
+
+    def api_list(self):
+        return self.values(*self.API_LIST_FIELDS)
+
 class Archer(BaseModel):
     """
     Model representing an archer.
@@ -63,32 +119,13 @@ class Archer(BaseModel):
     The Archer model inherits from BaseModel to include common fields for tracking creation and modification timestamps.
     """
 
-    def __init__(self, *args, **kwargs):
-        """
-        Initialize the Archer model and set up the slug field to be generated from the last_name field.
-        This method is called when an instance of the Archer model is created.
-        It allows for customization of the model's initialization process.
-        Args:
-            *args: Variable length argument list.
-            **kwargs: Arbitrary keyword arguments.
-        """
-
-        # Call the parent class's __init__ method to ensure proper initialization.
-        # This is necessary to ensure that the model is set up correctly.
-        # This allows the slug field to be automatically generated based on the last_name field.
-        # The populate_from argument specifies that the slug should be generated from the last_name field.
-        # This is useful for creating URL-friendly representations of the archer's name.
-        # It is useful for cases where archers may want to have a unique URL based on their last name.
-        super().__init__(*args, **kwargs)
-        self._meta.get_field('slug').populate_from = 'last_name'
-
     # id is a UUID field that serves as the primary key for the Archer model.
     # It is automatically generated and not editable.
     # This ensures that each archer has a unique identifier.
     # UUIDField is used to generate a universally unique identifier for each archer.
     # This is useful for ensuring that each archer can be uniquely identified across the application.
-    # The default value is set to uuid.uuid4(), which generates a new UUID each time a new archer is created.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # The default value is set to uuidv7(), which generates a new time-ordered UUID each time a new archer is created.
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
 
     # last_name is a CharField that stores the last name of the archer.
     # It is required and cannot be blank.
@@ -140,7 +177,7 @@ class Archer(BaseModel):
     # The slug field is not unique, allowing multiple archers to have the same slug.
     # This is useful for cases where multiple archers may share the same last name.
     # The slug is generated from the last_name field, ensuring that it is always based on the archer's last name.
-    slug = AutoSlugField(populate_from='last_name',editable=True)
+    slug = AutoSlugField(populate_from='last_name',editable=True,allow_duplicates=True)
 
     # union_number is a PositiveIntegerField that stores the union number of the archer.
     # It is not required and can be blank.
@@ -297,6 +334,8 @@ class Archer(BaseModel):
 
     # Extra information end
 
+    objects = ArcherQuerySet.as_manager()
+
     class Meta:
         """
         Meta options for the Archer model.
@@ -318,6 +357,19 @@ class Archer(BaseModel):
         # This is useful for displaying lists of archers in a user-friendly manner.
         ordering = ['last_name']
 
+        # Composite index matching the default ordering and name lookups,
+        # so sorted archer lists can be read from the index in order.
+        # Email is optional, so its index only covers rows that have one.
+        # union_number needs no extra index: it is unique, which already indexes it.
+        indexes = [
+            models.Index(fields=['last_name', 'first_name'], name='archer_name_idx'),
+            models.Index(
+                fields=['email'],
+                name='archer_email_idx',
+                condition=Q(email__isnull=False),
+            ),
+        ]
+
         # verbose_name is the singular name for the Archer model.
         # This is used in the Django admin interface and other places where a singular name is needed.
         # It provides a human-readable name for the model.
@@ -340,21 +392,24 @@ class Archer(BaseModel):
         # If middle_name is provided, include it in the string representation.
         # This allows for a more complete representation of the archer's name.
         # The string representation is useful for displaying the archer's name in lists and other contexts.
-        s_middle_name = ""
-        if self.middle_name:
-            s_middle_name = self.middle_name
-        return f"{self.last_name} {self.first_name} {s_middle_name}"
+        return f"{self.last_name} {self.first_name} {self.middle_name or ''}"
 
-    def __unicode__(self):
-        """ Return a unicode representation of the Archer model."""
+class ClubQuerySet(models.QuerySet):
+    """
+    QuerySet for the Club model.
+    with_members() loads the memberships of every club, with their
+    archers, in one extra query instead of one query per club.
+    """
 
-        # If middle_name is provided, include it in the unicode representation.
-        # This allows for a more complete representation of the archer's name.
-        # The unicode representation is useful for displaying the archer's name in lists and other contexts.
-        s_middle_name = ""
-        if self.middle_name:
-            s_middle_name = self.middle_name
-        return f"{self.last_name} {self.first_name} {s_middle_name}"
+    def with_members(self):
+        # The club of each membership is the prefetching club itself,
+        # so only the archer is joined.
+        return self.prefetch_related(
+            Prefetch(
+                'memberships',
+                queryset=Membership.objects.select_related(None).select_related('archer'),
+            )
+        )
 
 class Club(BaseModel):
     """
@@ -366,32 +421,13 @@ class Club(BaseModel):
     The Club model is used to represent an archery club, which can have multiple archers associated with it.
     """
 
-    def __init__(self, *args, **kwargs):
-        """
-        Initialize the Club model and set up the slug field to be generated from the name field.
-        This method is called when an instance of the Club model is created.
-        It allows for customization of the model's initialization process.
-        Args:
-            *args: Variable length argument list.
-            **kwargs: Arbitrary keyword arguments.
-        """
-
-        # Call the parent class's __init__ method to ensure proper initialization.
-        # This is necessary to ensure that the model is set up correctly.
-        # This allows the slug field to be automatically generated based on the name field.
-        # The populate_from argument specifies that the slug should be generated from the name field.
-        # This is useful for creating URL-friendly representations of the club.
-        # It is useful for cases where clubs may want to have a unique URL based on their name.
-        super().__init__(*args, **kwargs)
-        self._meta.get_field('slug').populate_from = 'name'
-
     # id is a UUID field that serves as the primary key for the Club model.
     # It is automatically generated and not editable.
     # This ensures that each club has a unique identifier.
     # UUIDField is used to generate a universally unique identifier for each club.
     # This is useful for ensuring that each club can be uniquely identified across the application.
-    # The default value is set to uuid.uuid4(), which generates a new UUID each time a new club is created.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # The default value is set to uuidv7(), which generates a new time-ordered UUID each time a new club is created.
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
 
     # name is a CharField that stores the name of the club.
     # It is required and cannot be blank.
@@ -415,7 +451,7 @@ class Club(BaseModel):
     # The slug field is not unique, allowing multiple clubs to have the same slug.
     # This is useful for cases where multiple clubs may share the same name or are located in different areas.
     # The slug is generated from the name field, ensuring that it is always based on the club's name.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     # town is a CharField that stores the name of the town where the club is located.
     # It is not required and can be blank.
@@ -512,6 +548,12 @@ class Club(BaseModel):
         # This is useful for displaying lists of clubs in a user-friendly manner.
         verbose_name_plural = _("Clubs")
 
+        # ClubFilter offers created_at__lt/__gt, which can range-scan this
+        # index instead of reading the whole table.
+        indexes = [
+            models.Index(fields=['created_at'], name='club_created_at_idx'),
+        ]
+
     def __str__(self):
         """
         Return a string representation of the Club model.
@@ -519,12 +561,19 @@ class Club(BaseModel):
 
         return self.name
 
-    def __unicode__(self):
+    objects = ClubQuerySet.as_manager()
+
+    # Columns needed to list the members of a club, including the ones Archer.__str__ reads.
+    MEMBER_LIST_FIELDS = ('id', 'last_name', 'first_name', 'middle_name', 'slug')
+
+    def members_short(self):
         """
-        Return a unicode representation of the Club model.
+        Return the archers of this club, loading only the columns needed to list them.
+        For many clubs at once, use
+        Prefetch('archers', queryset=Archer.objects.only(*Club.MEMBER_LIST_FIELDS)).
         """
 
-        return self.name
+        return self.archers.only(*self.MEMBER_LIST_FIELDS).order_by('last_name')
 
 class Membership(BaseModel):
     """
@@ -536,8 +585,8 @@ class Membership(BaseModel):
     # This ensures that each membership has a unique identifier.
     # UUIDField is used to generate a universally unique identifier for each membership.
     # This is useful for ensuring that each membership can be uniquely identified across the application.
-    # The default value is set to uuid.uuid4(), which generates a new UUID each time a new membership is created.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # The default value is set to uuidv7(), which generates a new time-ordered UUID each time a new membership is created.
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
 
     # club is a ForeignKey that links the Membership model to the Club model.
     # It uses PROTECT to prevent deletion of the club if there are memberships linked to it.
@@ -605,25 +654,50 @@ class Membership(BaseModel):
         help_text=_("format: Y-m-d, not required"),
     )
 
-    def __str__(self):
+    # __str__ follows archer and club, so they are joined by default.
+    objects = MembershipManager()
+
+    @classmethod
+    def bulk_import(cls, rows, batch_size=1000):
+        """Insert memberships from dicts of field values in batches."""
+        # Pairs that already exist are skipped by the (club, archer) unique constraint.
+        return cls.objects.bulk_create(
+            [cls(**row) for row in rows],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+
+    @cached_property
+    def display(self):
         """
-        Return a string representation of the Membership model.
+        Return the description of the membership, built once per instance.
         """
 
         # Use the string representation of the archer and club to create a meaningful description.
-        # The string representation is useful for displaying the membership in lists and other contexts.
-        # This allows for a more complete representation of the membership.
-        return f"{str(self.archer)} - {str(self.club)} {self.club.town}"
+        # Admin and API list pages call str() on the same membership repeatedly,
+        # so the composed string is cached on the instance.
+        return f"{self.archer} - {self.club} {self.club.town}"
 
-    def __unicode__(self):
+    def __str__(self):
         """
-        Return a unicode representation of the Membership model.
+        Return a string representation of the Membership model.
         """
 
-        # Use the string representation of the archer and club to create a meaningful description.
-        # The unicode representation is useful for displaying the membership in lists and other contexts.
-        # This allows for a more complete representation of the membership.
-        return f"{str(self.archer)} - {str(self.club)} {self.club.town}"
+        return self.display
+
+    class Meta:
+        # An archer is a member of a club only once. The unique constraint
+        # also indexes (club, archer) for listing the members of a club,
+        # the reverse index serves listing the clubs of an archer.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['club', 'archer'],
+                name='membership_club_archer_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'club'], name='membership_archer_club_idx'),
+        ]
 
 class Category(BaseModel):
     """
@@ -638,7 +712,7 @@ class Category(BaseModel):
     # TODO: Continue here with commenting
 
     # id is a UUID field that serves as the primary key for the Category model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a CharField that stores the name of the category.
     # It is required and cannot be blank.
     name = models.CharField(
@@ -651,7 +725,7 @@ class Category(BaseModel):
     )
     # slug is an AutoSlugField that automatically generates a slug from the name of the category.
     # It is editable and can be used for URL-friendly representations.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     archers = models.ManyToManyField(
         Archer,
         through='CategoryMembership',
@@ -680,11 +754,8 @@ class Category(BaseModel):
     def __str__(self):
         return self.name
 
-    def __unicode__(self):
-        return self.name
-
 class CategoryMembership(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     category = models.ForeignKey(
         Category,
         on_delete=models.PROTECT,
@@ -702,14 +773,64 @@ class CategoryMembership(BaseModel):
         related_name='categorymembership_archer'
     )
 
+    objects = CategoryMembershipManager()
+
+    @classmethod
+    def bulk_import(cls, rows, batch_size=1000):
+        """Insert memberships from dicts of field values in batches."""
+        # Pairs that already exist are skipped by the (category, archer) unique constraint.
+        return cls.objects.bulk_create(
+            [cls(**row) for row in rows],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+
     def __str__(self):
-        return f"{str(self.archer)} - {str(self.category)}"
+        return f"{self.archer} - {self.category}"
+
+    class Meta:
+        # An archer is in a category only once; see Membership.Meta.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['category', 'archer'],
+                name='categorymembership_category_archer_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'category'], name='catmember_archer_category_idx'),
+        ]
+
+BOW_TYPES = (
+    ("recurve", "Recurve"),
+    ("compound", "Compound"),
+    ("longbow", "Longbow"),
+    ("barebow", "Barebow"),
+    ("crossbow", "Crossbow"),
+    ("other", "Other"),
+)
+
+BOW_COLORS = (
+    ("black", "Black"),
+    ("brown", "Brown"),
+    ("white", "White"),
+    ("red", "Red"),
+    ("blue", "Blue"),
+    ("green", "Green"),
+    ("yellow", "Yellow"),
+    ("other", "Other"),
+)
 
-    def __unicode__(self):
-        return f"{str(self.archer)} - {str(self.category)}"
+BOW_MATERIALS = (
+    ("wood", "Wood"),
+    ("carbon", "Carbon"),
+    ("aluminum", "Aluminum"),
+    ("fiberglass", "Fiberglass"),
+    ("composite", "Composite"),
+    ("other", "Other"),
+)
 
 class BowType(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -718,7 +839,7 @@ class BowType(BaseModel):
         verbose_name=_("bow type name"),
         help_text=_("format: required, max-64")
     )
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     archer = models.ManyToManyField(
         Archer,
         blank=True,
@@ -746,40 +867,33 @@ class BowType(BaseModel):
         blank=True,
         verbose_name=_("bow type"),
         help_text=_("format: not required, max-32"),
-        choices=[
-            ("recurve", "Recurve"),
-            ("compound", "Compound"),
-            ("longbow", "Longbow"),
-            ("barebow", "Barebow"),
-            ("crossbow", "Crossbow"),
-            ("other", "Other")
-        ]
+        choices=BOW_TYPES,
     )
-    max_draw_weight = models.PositiveIntegerField(
+    max_draw_weight = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("maximum draw weight"),
         help_text=_("format: not required"),
     )
-    min_draw_weight = models.PositiveIntegerField(
+    min_draw_weight = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("minimum draw weight"),
         help_text=_("format: not required"),
     )
-    max_draw_length = models.PositiveIntegerField(
+    max_draw_length = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("maximum draw length in inches"),
         help_text=_("format: not required"),
     )
-    min_draw_length = models.PositiveIntegerField(
+    min_draw_length = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("minimum draw length in inches"),
         help_text=_("format: not required"),
     )
-    length = models.PositiveIntegerField(
+    length = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("bow length in inches"),
@@ -791,16 +905,7 @@ class BowType(BaseModel):
         blank=True,
         verbose_name=_("bow color"),
         help_text=_("format: not required, max-32"),
-        choices=[
-            ("black", "Black"),
-            ("brown", "Brown"),
-            ("white", "White"),
-            ("red", "Red"),
-            ("blue", "Blue"),
-            ("green", "Green"),
-            ("yellow", "Yellow"),
-            ("other", "Other")
-        ]
+        choices=BOW_COLORS,
     )
     material = models.CharField(
         max_length=32,
@@ -808,14 +913,7 @@ class BowType(BaseModel):
         blank=True,
         verbose_name=_("bow material"),
         help_text=_("format: not required, max-32"),
-        choices=[
-            ("wood", "Wood"),
-            ("carbon", "Carbon"),
-            ("aluminum", "Aluminum"),
-            ("fiberglass", "Fiberglass"),
-            ("composite", "Composite"),
-            ("other", "Other")
-        ]
+        choices=BOW_MATERIALS,
     )
     # Specific fields end  
 
@@ -827,11 +925,8 @@ class BowType(BaseModel):
     def __str__(self):
         return self.name
 
-    def __unicode__(self):
-        return self.name
-
 class BowTypeMembership(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     bowtype = models.ForeignKey(
         BowType,
         on_delete=models.PROTECT,
@@ -849,14 +944,35 @@ class BowTypeMembership(BaseModel):
         related_name='bowtypemembership_archer'
     )
 
+    objects = BowTypeMembershipManager()
+
+    @classmethod
+    def bulk_import(cls, rows, batch_size=1000):
+        """Insert memberships from dicts of field values in batches."""
+        # Pairs that already exist are skipped by the (bowtype, archer) unique constraint.
+        return cls.objects.bulk_create(
+            [cls(**row) for row in rows],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+
     def __str__(self):
-        return f"{str(self.archer)} - {str(self.bowtype)}"
+        return f"{self.archer} - {self.bowtype}"
 
-    def __unicode__(self):
-        return f"{str(self.archer)} - {str(self.bowtype)}"
+    class Meta:
+        # An archer is in a bow type only once; see Membership.Meta.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['bowtype', 'archer'],
+                name='bowtypemembership_bowtype_archer_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'bowtype'], name='btmember_archer_bowtype_idx'),
+        ]
 
 class BowString(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -865,7 +981,7 @@ class BowString(BaseModel):
         verbose_name=_("bowstring name"),
         help_text=_("format: required, max-64")
     )
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     bowtype = models.ForeignKey(
         BowType,
         on_delete=models.PROTECT,
@@ -889,7 +1005,7 @@ class BowString(BaseModel):
     )
 
     # Extra fields
-    length = models.PositiveIntegerField(
+    length = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("bowstring length in inches"),
@@ -901,16 +1017,7 @@ class BowString(BaseModel):
         blank=True,
         verbose_name=_("bowstring color"),
         help_text=_("format: not required, max-32"),
-        choices=[
-            ("black", "Black"),
-            ("brown", "Brown"),
-            ("white", "White"),
-            ("red", "Red"),
-            ("blue", "Blue"),
-            ("green", "Green"),
-            ("yellow", "Yellow"),
-            ("other", "Other")
-        ]
+        choices=BOW_COLORS,
     )
     material = models.CharField(
         max_length=32,
@@ -933,11 +1040,8 @@ class BowString(BaseModel):
     def __str__(self):
         return self.name
 
-    def __unicode__(self):
-        return self.name
-
 class BowRiser(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -946,7 +1050,7 @@ class BowRiser(BaseModel):
         verbose_name=_("bowriser name"),
         help_text=_("format: required, max-64")
     )
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     bowtype = models.ForeignKey(
         BowType,
         on_delete=models.PROTECT,
@@ -970,7 +1074,7 @@ class BowRiser(BaseModel):
     )
 
     # Extra fields
-    length = models.PositiveIntegerField(
+    length = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("bowriser length in inches"),
@@ -982,16 +1086,7 @@ class BowRiser(BaseModel):
         blank=True,
         verbose_name=_("bowriser color"),
         help_text=_("format: not required, max-32"),
-        choices=[
-            ("black", "Black"),
-            ("brown", "Brown"),
-            ("white", "White"),
-            ("red", "Red"),
-            ("blue", "Blue"),
-            ("green", "Green"),
-            ("yellow", "Yellow"),
-            ("other", "Other")
-        ]
+        choices=BOW_COLORS,
     )
     material = models.CharField(
         max_length=32,
@@ -999,14 +1094,7 @@ class BowRiser(BaseModel):
         blank=True,
         verbose_name=_("bowriser material"),
         help_text=_("format: not required, max-32"),
-        choices=[
-            ("wood", "Wood"),
-            ("carbon", "Carbon"),
-            ("aluminum", "Aluminum"),
-            ("fiberglass", "Fiberglass"),
-            ("composite", "Composite"),
-            ("other", "Other")
-        ]
+        choices=BOW_MATERIALS,
     )
 
     # Extra fields end
@@ -1017,11 +1105,9 @@ class BowRiser(BaseModel):
 
     def __str__(self):
         return self.name
-    def __unicode__(self):
-        return self.name
 
 class BowLimb(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1030,7 +1116,7 @@ class BowLimb(BaseModel):
         verbose_name=_("bowlimb name"),
         help_text=_("format: required, max-64")
     )
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     bowtype = models.ForeignKey(
         BowType,
         on_delete=models.PROTECT,
@@ -1054,7 +1140,7 @@ class BowLimb(BaseModel):
     )
 
     # Extra fields
-    length = models.PositiveIntegerField(
+    length = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("bowlimb length in inches"),
@@ -1066,16 +1152,7 @@ class BowLimb(BaseModel):
         blank=True,
         verbose_name=_("bowlimb color"),
         help_text=_("format: not required, max-32"),
-        choices=[
-            ("black", "Black"),
-            ("brown", "Brown"),
-            ("white", "White"),
-            ("red", "Red"),
-            ("blue", "Blue"),
-            ("green", "Green"),
-            ("yellow", "Yellow"),
-            ("other", "Other")
-        ]
+        choices=BOW_COLORS,
     )
     material = models.CharField(
         max_length=32,
@@ -1083,24 +1160,17 @@ class BowLimb(BaseModel):
         blank=True,
         verbose_name=_("bowlimb material"),
         help_text=_("format: not required, max-32"),
-        choices=[
-            ("wood", "Wood"),
-            ("carbon", "Carbon"),
-            ("aluminum", "Aluminum"),
-            ("fiberglass", "Fiberglass"),
-            ("composite", "Composite"),
-            ("other", "Other")
-        ]
+        choices=BOW_MATERIALS,
     )
     # Tension is the force applied to the bow limb when drawn, measured in pounds.
-    tension = models.PositiveIntegerField(
+    tension = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("bowlimb tension in pounds"),
         help_text=_("format: not required"),
     )
     # Draw weight is the weight required to draw the bow limb to its full draw length, measured in pounds.
-    draw_weight = models.PositiveIntegerField(
+    draw_weight = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("bowlimb draw weight in pounds"),
@@ -1122,7 +1192,7 @@ class BowLimb(BaseModel):
         ]
     )
     # Draw length is the distance from the bowstring to the back of the bow limb when drawn, measured in inches.
-    draw_length = models.PositiveIntegerField(
+    draw_length = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("bowlimb draw length in inches"),
@@ -1157,7 +1227,7 @@ class BowLimb(BaseModel):
         ]
     )
     # Limb weight is the weight of the bow limb itself, measured in pounds.
-    limb_weight = models.PositiveIntegerField(
+    limb_weight = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("bowlimb weight in pounds"),
@@ -1185,13 +1255,35 @@ class BowLimb(BaseModel):
         verbose_name_plural = _("Bow Limbs")
 
     def __str__(self):
-       return
+        return self.name
+
+    def adjust_tension(self, tension):
+        """
+        Store a new tension, updating only that column and modified_at.
+        """
+        self.tension = tension
+        self.save(update_fields=['tension', 'modified_at'])
+
+class ArcherMembersQuerySet(models.QuerySet):
+    """
+    QuerySet for models with an `archer` many-to-many field
+    (Team, Contest and Competition).
+    with_members() loads the archers of every row in one extra query
+    instead of one query per row.
+    """
+
+    def with_members(self):
+        return self.prefetch_related('archer')
+
+    def with_archer_count(self):
+        # One grouped query instead of archer.count() per row.
+        return self.annotate(archer_count=Count('archer'))
 
 class Team(BaseModel):
     '''Model representing a team of archers.'''
 
     '''id is a UUID field that serves as the primary key for the Team model.'''
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1201,10 +1293,11 @@ class Team(BaseModel):
         help_text=_("format: required, max-64")
     )
     '''slug is a unique identifier for the team, automatically generated from the name.'''
-    slug = AutoSlugField(populate_from='name',editable=True)
-    '''archer is a many-to-many relationship with the Archer model, allowing multiple archers to be part of a team.'''
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
+    '''archer is a many-to-many relationship with the Archer model, stored in TeamMembership, allowing multiple archers to be part of a team.'''
     archer = models.ManyToManyField(
         Archer,
+        through='TeamMembership',
         blank=True,
         help_text=_("format: not required"),
         related_name='teams'
@@ -1225,6 +1318,8 @@ class Team(BaseModel):
         related_name='team_author'
     )
 
+    objects = ArcherMembersQuerySet.as_manager()
+
     class Meta:
         '''verbose_name is the singular name for the Team model.'''
         verbose_name = _("Team")
@@ -1235,12 +1330,8 @@ class Team(BaseModel):
         '''Returns the name of the team.'''
         return self.name
 
-    def __unicode__(self):
-        '''Returns the name of the team in unicode format.'''
-        return self.name
-
 class TeamMembership(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     team = models.ForeignKey(
         Team,
         on_delete=models.PROTECT,
@@ -1258,14 +1349,40 @@ class TeamMembership(BaseModel):
         related_name='teammembership_archer'
     )
 
+    @classmethod
+    def bulk_enroll(cls, team, archers):
+        """Enroll archers in the team in batches, skipping current members."""
+        # The (team, archer) unique constraint turns rows that already exist,
+        # repeated archers and concurrent enrolments into no-ops.
+        return cls.objects.bulk_create(
+            [cls(team=team, archer=archer) for archer in archers],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+    @cached_property
+    def display(self):
+        # Cached like Membership.display, str() is called repeatedly on list pages.
+        return f"{self.archer} - {self.team}"
+
     def __str__(self):
-        return f"{str(self.archer)} - {str(self.team)}"
+        return self.display
 
-    def __unicode__(self):
-        return f"{str(self.archer)} - {str(self.team)}"
+    class Meta:
+        # Same layout as Membership: the unique constraint indexes
+        # (team, archer), the reverse index serves the teams of an archer.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['team', 'archer'],
+                name='teammembership_team_archer_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'team'], name='teammember_archer_team_idx'),
+        ]
 
 class Contest(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1274,9 +1391,10 @@ class Contest(BaseModel):
         verbose_name=_("contest name"),
         help_text=_("format: required, max-64")
     )
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     archer = models.ManyToManyField(
         Archer,
+        through='ContestMembership',
         blank=True,
         help_text=_("format: not required"),
         related_name='contests'
@@ -1311,6 +1429,8 @@ class Contest(BaseModel):
         related_name='contest_author'
     )
 
+    objects = ArcherMembersQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Contest")
         verbose_name_plural = _("Contests")
@@ -1318,11 +1438,8 @@ class Contest(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class ContestMembership(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     contest = models.ForeignKey(
         Contest,
         on_delete=models.PROTECT,
@@ -1340,11 +1457,37 @@ class ContestMembership(BaseModel):
         related_name='contestmembership_archer'
     )
 
+    @classmethod
+    def bulk_enroll(cls, contest, archers):
+        """Enroll archers in the contest in batches, skipping current members."""
+        # The (contest, archer) unique constraint turns rows that already exist,
+        # repeated archers and concurrent enrolments into no-ops.
+        return cls.objects.bulk_create(
+            [cls(contest=contest, archer=archer) for archer in archers],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+    @cached_property
+    def display(self):
+        # Cached like Membership.display, str() is called repeatedly on list pages.
+        return f"{self.archer} - {self.contest}"
+
     def __str__(self):
-        return f"{str(self.archer)} - {str(self.contest)}"
+        return self.display
 
-    def __unicode__(self):
-        return f"{str(self.archer)} - {str(self.contest)}"
+    class Meta:
+        # Same layout as Membership: the unique constraint indexes
+        # (contest, archer), the reverse index serves the contests of an archer.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['contest', 'archer'],
+                name='contestmembership_contest_archer_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'contest'], name='ctmember_archer_contest_idx'),
+        ]
 
 TARGET_DIAMETERS = (
     ("40 cm", "40 cm"),
@@ -1354,7 +1497,7 @@ TARGET_DIAMETERS = (
 )
 
 class TargetFace(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1363,7 +1506,7 @@ class TargetFace(BaseModel):
         verbose_name=_("targetface name"),
         help_text=_("format: required, max-64")
     )
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     diameter = models.CharField (
         null=False,
         unique=False,
@@ -1395,16 +1538,13 @@ class TargetFace(BaseModel):
     def __str__(self):
         return f"{self.name} ( {self.diameter} )"
 
-    def __unicode__(self):
-        return f"{self.name} ( {self.diameter} )"
-
 SHEET_DIMENSIONS = (
     ("10x3", "10x3"),
     ("5x5", "5x5"),
 )
 
 class ScoringSheet(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1413,7 +1553,7 @@ class ScoringSheet(BaseModel):
         verbose_name=_("scoringsheet name"),
         help_text=_("format: not required, max-64")
     )
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     dimension = models.CharField (
         null=True,
         unique=False,
@@ -1445,11 +1585,45 @@ class ScoringSheet(BaseModel):
     def __str__(self):
         return f"{self.name} ( {self.dimension} )"
 
-    def __unicode__(self):
-        return f"{self.name} ( {self.dimension} )"
+class ResultQuerySet(models.QuerySet):
+    """
+    QuerySet for the Result model.
+    with_related() joins every foreign key of a result, so a leaderboard
+    that shows the archer, contest, targetface and scoringsheet of each
+    row runs a single query.
+    """
+
+    def with_related(self):
+        return self.select_related(
+            'archer',
+            'contest',
+            'targetface',
+            'scoringsheet',
+            'author',
+        )
+
+    def leaderboard(self, contest):
+        """
+        Return one row per archer of the contest with the summed score,
+        the summed arrows and the score per arrow, best average first.
+        The totals are aggregated by the database in a single query.
+        """
+        return (
+            self.filter(contest=contest)
+            .values('archer', 'archer__last_name', 'archer__first_name')
+            .annotate(
+                score_total=Sum('score'),
+                arrow_total=Sum('arrows'),
+                score_average=functions.Round(
+                    Cast(NullIf(Sum('score'), 0), models.FloatField()) / NullIf(Sum('arrows'), 0),
+                    2,
+                ),
+            )
+            .order_by(F('score_average').desc(nulls_last=True))
+        )
 
 class Result(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     archer=models.ForeignKey(
         Archer,
         on_delete=models.PROTECT,
@@ -1498,7 +1672,6 @@ class Result(BaseModel):
         verbose_name=_("nr of points shot"),
         help_text=_("format: not required"),
     )
-    slug = AutoSlugField(populate_from='score',editable=True)
     arrows=models.PositiveSmallIntegerField(
         default=0,
         null=False,
@@ -1515,6 +1688,18 @@ class Result(BaseModel):
         verbose_name=_("shooting distance in meters"),
         help_text=_("format: not required"),
     )
+    # average is the score per arrow rounded to 2 decimals, stored by the
+    # database so leaderboards can filter and order on it.
+    # It is null when score or arrows is 0.
+    average = models.GeneratedField(
+        expression=functions.Round(
+            Cast(NullIf('score', 0), models.FloatField()) / NullIf('arrows', 0),
+            2,
+        ),
+        output_field=models.FloatField(),
+        db_persist=True,
+        verbose_name=_("average points per arrow"),
+    )
     info = models.TextField(
         null=True,
         blank=True,
@@ -1529,28 +1714,33 @@ class Result(BaseModel):
         related_name='result_author'
     )
 
+    objects = ResultQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Result")
         verbose_name_plural = _("Results")
+        # (contest, -score) serves contest leaderboards without a sort,
+        # (archer, contest) serves the results of an archer.
+        indexes = [
+            models.Index(fields=['contest', '-score'], name='result_contest_score_idx'),
+            models.Index(fields=['archer', 'contest'], name='result_archer_contest_idx'),
+        ]
 
     def __str__(self):
         return str(self.score)
 
-    def __unicode__(self):
-        return str(self.score)
-
-    @property
-    def average(self):
-        result = None
-
-        if self.score and self.arrows:
-            if (self.arrows > 0):
-                result = round(self.score / self.arrows, 2)
-
-        return result
+    def record_score(self, score, arrows):
+        """
+        Store a new score and arrow count, updating only those columns.
+        """
+        self.score = score
+        self.arrows = arrows
+        self.save(update_fields=['score', 'arrows', 'modified_at'])
+        # Drop the stale value, the next access loads the one the database computed.
+        self.__dict__.pop('average', None)
 
 class Competition(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1559,9 +1749,10 @@ class Competition(BaseModel):
         verbose_name=_("competition name"),
         help_text=_("format: required, max-64")
     )
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     archer = models.ManyToManyField(
         Archer,
+        through='CompetitionMembership',
         blank=True,
         help_text=_("format: not required"),
         related_name='competitions'
@@ -1580,6 +1771,8 @@ class Competition(BaseModel):
         related_name='competition_author'
     )
 
+    objects = ArcherMembersQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Competition")
         verbose_name_plural = _("Competitions")
@@ -1587,11 +1780,8 @@ class Competition(BaseModel):
     def __str__(self):
         return self.name
 
-    def __unicode__(self):
-        return self.name
-
 class CompetitionMembership(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     competition = models.ForeignKey(
         Competition,
         on_delete=models.PROTECT,
@@ -1609,14 +1799,40 @@ class CompetitionMembership(BaseModel):
         related_name='competitionmembership_archer'
     )
 
+    @classmethod
+    def bulk_enroll(cls, competition, archers):
+        """Enroll archers in the competition in batches, skipping current members."""
+        # The (competition, archer) unique constraint turns rows that already exist,
+        # repeated archers and concurrent enrolments into no-ops.
+        return cls.objects.bulk_create(
+            [cls(competition=competition, archer=archer) for archer in archers],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+    @cached_property
+    def display(self):
+        # Cached like Membership.display, str() is called repeatedly on list pages.
+        return f"{self.archer} - {self.competition}"
+
     def __str__(self):
-        return f"{str(self.archer)} - {str(self.competition)}"
+        return self.display
 
-    def __unicode__(self):
-        return f"{str(self.archer)} - {str(self.competition)}"
+    class Meta:
+        # Same layout as Membership: the unique constraint indexes
+        # (competition, archer), the reverse index serves the competitions of an archer.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['competition', 'archer'],
+                name='competitionmembership_competition_archer_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'competition'], name='compmember_archer_comp_idx'),
+        ]
 
 class Arrow(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1625,7 +1841,7 @@ class Arrow(BaseModel):
         verbose_name=_("arrow name"),
         help_text=_("format: required, max-64")
     )
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     info = models.TextField(
         null=True,
         blank=True,
@@ -1641,25 +1857,25 @@ class Arrow(BaseModel):
     )
 
     # Specific fields
-    length = models.PositiveIntegerField(
+    length = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("arrow length in inches"),
         help_text=_("format: not required"),
     )
-    diameter = models.PositiveIntegerField(
+    diameter = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("arrow diameter in mm"),
         help_text=_("format: not required"),
     )
-    spine = models.PositiveIntegerField(
+    spine = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("arrow spine"),
         help_text=_("format: not required"),
     )
-    weight = models.PositiveIntegerField(
+    weight = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("arrow weight in grains"),
@@ -1673,16 +1889,13 @@ class Arrow(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class ArrowType(BaseModel):
     """
     Model representing an arrow type used in archery.
     """
 
     # id is a UUID field that serves as the primary key for the ArrowType model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the arrow type, which describes the type of arrow.
     name = models.CharField(
         max_length=64,
@@ -1693,7 +1906,7 @@ class ArrowType(BaseModel):
         help_text=_("format: required, max-64")
     )
     # slug is a unique identifier for the arrow type, automatically generated from the name.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     # info is a text field for additional information about the arrow type.
     info = models.TextField(
         null=True,
@@ -1715,15 +1928,13 @@ class ArrowType(BaseModel):
        verbose_name_plural = _("Arrow Types")
     def __str__(self):
        return self.name
-    def __unicode__(self):
-       return self.name
 class ArrowTypeMembership(BaseModel):
     """
     Model representing the relationship between an arrow and its type.
     """
 
     # id is a UUID field that serves as the primary key for the ArrowTypeMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # arrow is a foreign key to the Arrow model, indicating which arrow is being associated with the type.
     arrow = models.ForeignKey(
         Arrow,
@@ -1759,20 +1970,14 @@ class ArrowTypeMembership(BaseModel):
         Returns a string representation of the ArrowTypeMembership instance.
         This representation includes the arrow and arrow type names.
         """
-        return f"{str(self.arrow)} - {str(self.arrowtype)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the ArrowTypeMembership instance.
-        This representation includes the arrow and arrow type names.
-        """
-        return f"{str(self.arrow)} - {str(self.arrowtype)}"
+        return f"{self.arrow} - {self.arrowtype}"
 
 class Fletching(BaseModel):
     """
     Model representing a fletching used in archery arrows.
     """
     # id is a UUID field that serves as the primary key for the Fletching model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the fletching, which is a part of the arrow that stabilizes its flight.
     name = models.CharField(
         max_length=64,
@@ -1783,7 +1988,7 @@ class Fletching(BaseModel):
         help_text=_("format: required, max-64")
     )
     # slug is a unique identifier for the fletching, automatically generated from the name.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     # arrow is a many-to-many relationship with the Arrow model, allowing multiple arrows to be associated with a fletching.
     arrow = models.ManyToManyField(
         Arrow,
@@ -1815,16 +2020,7 @@ class Fletching(BaseModel):
         blank=True,
         verbose_name=_("fletching color"),
         help_text=_("format: not required, max-32"),
-        choices=[
-            ("black", "Black"),
-            ("brown", "Brown"),
-            ("white", "White"),
-            ("red", "Red"),
-            ("blue", "Blue"),
-            ("green", "Green"),
-            ("yellow", "Yellow"),
-            ("other", "Other")
-        ]
+        choices=BOW_COLORS,
     )
     # Fletching material is the type of material used for the fletching, which can affect arrow flight and stability.
     material = models.CharField(
@@ -1840,42 +2036,42 @@ class Fletching(BaseModel):
         ]
     )
     # Fletching length is the length of the fletching, which can affect arrow flight and stability.
-    length = models.PositiveIntegerField(
+    length = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("fletching length in inches"),
         help_text=_("format: not required"),
     )
     # Fletching width is the width of the fletching, which can affect arrow flight and stability.
-    width = models.PositiveIntegerField(
+    width = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("fletching width in inches"),
         help_text=_("format: not required"),
     )
     # Fletching height is the height of the fletching, which can affect arrow flight and stability.
-    height = models.PositiveIntegerField(
+    height = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("fletching height in inches"),
         help_text=_("format: not required"),
     )
     # Fletching weight is the weight of the fletching, which can affect arrow flight and stability.
-    weight = models.PositiveIntegerField(
+    weight = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("fletching weight in grains"),
         help_text=_("format: not required"),
     )
     # Fletching thickness is the thickness of the fletching material, which can affect arrow flight and stability.
-    thickness = models.PositiveIntegerField(
+    thickness = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("fletching thickness in mm"),
         help_text=_("format: not required"),
     )
     # Fletching position is the position of the fletching on the arrow shaft, measured in inches from the nock end.
-    position = models.PositiveIntegerField(
+    position = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("fletching position in inches"),
@@ -1896,7 +2092,7 @@ class Fletching(BaseModel):
         ]
     )
     # Fletching angle is the angle at which the fletching is attached to the arrow shaft, measured in degrees.
-    angle = models.PositiveIntegerField(
+    angle = models.PositiveSmallIntegerField(
         null=True,
         blank=True,
         verbose_name=_("fletching angle in degrees"),
@@ -1920,20 +2116,23 @@ class Fletching(BaseModel):
     class Meta:
        verbose_name = _("Fletching")
        verbose_name_plural = _("Fletchings")
+       constraints = [
+           models.CheckConstraint(
+               condition=Q(angle__lte=360),
+               name='fletching_angle_lte_360',
+           ),
+       ]
 
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class ArrowFletching(BaseModel):
     """
     Model representing the relationship between an arrow and its fletching.
     """
 
     # id is a UUID field that serves as the primary key for the ArrowFletching model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # arrow is a foreign key to the Arrow model, indicating which arrow is being fletched.
     arrow = models.ForeignKey(
         Arrow,
@@ -1966,19 +2165,19 @@ class ArrowFletching(BaseModel):
         # verbose_name_plural is the plural name for the ArrowFletching model.
         verbose_name_plural = _("Arrow Fletchings")
 
-    def __str__(self):
+    @cached_property
+    def display(self):
         """
-        Returns a string representation of the ArrowFletching instance.
-        This representation includes the arrow and fletching names.
+        Returns the arrow and fletching names, built once per instance.
         """
-        return f"{str(self.arrow)} - {str(self.fletching)}"
+        return f"{self.arrow} - {self.fletching}"
 
-    def __unicode__(self):
+    def __str__(self):
         """
-        Returns a unicode representation of the ArrowFletching instance.
+        Returns a string representation of the ArrowFletching instance.
         This representation includes the arrow and fletching names.
         """
-        return f"{str(self.arrow)} - {str(self.fletching)}"
+        return self.display
 
 class BowSight(BaseModel):
     """
@@ -1986,7 +2185,7 @@ class BowSight(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the BowSight model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the bow sight.
     name = models.CharField(
         max_length=64,
@@ -1997,7 +2196,7 @@ class BowSight(BaseModel):
         help_text=_("format: required, max-64")
     )
     # slug is a unique identifier for the bow sight, automatically generated from the name.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     # bowtype is a foreign key to the BowType model, indicating which type of bow the sight is compatible with.
     bowtype = models.ForeignKey(
         BowType,
@@ -2089,16 +2288,13 @@ class BowSight(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class BowSightArcher(BaseModel):
     """
     Model representing the relationship between an archer and a bow sight.
     """
 
     # id is a UUID field that serves as the primary key for the BowSightArcher model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bowsight is a foreign key to the BowSight model, indicating which bow sight is being used by the archer.
     bowsight = models.ForeignKey(
         BowSight,
@@ -2134,13 +2330,7 @@ class BowSightArcher(BaseModel):
         Returns a string representation of the BowSightArcher instance.
         This representation includes the archer and bow sight names.
         """
-        return f"{str(self.archer)} - {str(self.bowsight)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BowSightArcher instance.
-        This representation includes the archer and bow sight names.
-        """
-        return f"{str(self.archer)} - {str(self.bowsight)}"
+        return f"{self.archer} - {self.bowsight}"
 
 class Round(BaseModel):
     """
@@ -2148,7 +2338,7 @@ class Round(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the Round model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the round, which describes the round type.
     name = models.CharField(
         max_length=64,
@@ -2159,7 +2349,7 @@ class Round(BaseModel):
         help_text=_("format: required, max-64")
     )
     # slug is a unique identifier for the round, automatically generated from the name.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     # targetface is a foreign key to the TargetFace model, indicating which target face is used in this round.
     targetface = models.ForeignKey(
         TargetFace,
@@ -2200,16 +2390,13 @@ class Round(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class RoundMembership(BaseModel):
     """
     Model representing the relationship between a round and an archer.
     """
 
     # id is a UUID field that serves as the primary key for the RoundMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # round is a foreign key to the Round model, indicating which round is being participated in.
     round = models.ForeignKey(
         Round,
@@ -2245,13 +2432,7 @@ class RoundMembership(BaseModel):
         Returns a string representation of the RoundMembership instance.
         This representation includes the archer and round names.
         """
-        return f"{str(self.archer)} - {str(self.round)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the RoundMembership instance.
-        This representation includes the archer and round names.
-        """
-        return f"{str(self.archer)} - {str(self.round)}"
+        return f"{self.archer} - {self.round}"
 
 class Distance(BaseModel):
     """
@@ -2259,7 +2440,7 @@ class Distance(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the Distance model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the distance, which describes the distance type.
     name = models.CharField(
         max_length=64,
@@ -2270,7 +2451,7 @@ class Distance(BaseModel):
         help_text=_("format: required, max-64")
     )
     # slug is a unique identifier for the distance, automatically generated from the name.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     # info is a text field for additional information about the distance.
     info = models.TextField(
         null=True,
@@ -2293,9 +2474,6 @@ class Distance(BaseModel):
 
     def __str__(self):
        return self.name
-
-    def __unicode__(self):
-       return self.name
     
 class RoundDistance(BaseModel):
     """
@@ -2303,7 +2481,7 @@ class RoundDistance(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the RoundDistance model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # round is a foreign key to the Round model, indicating which round is being associated with the distance.
     round = models.ForeignKey(
         Round,
@@ -2341,14 +2519,7 @@ class RoundDistance(BaseModel):
         Returns a string representation of the RoundDistance instance.
         This representation includes the round and distance names.
         """
-        return f"{str(self.round)} - {str(self.distance)}"
-
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the RoundDistance instance.
-        This representation includes the round and distance names.
-        """
-        return f"{str(self.round)} - {str(self.distance)}"
+        return f"{self.round} - {self.distance}"
 
 class Range(BaseModel):
     """
@@ -2356,7 +2527,7 @@ class Range(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the Range model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the range, which describes the range type.
     name = models.CharField(
         max_length=64,
@@ -2367,7 +2538,7 @@ class Range(BaseModel):
         help_text=_("format: required, max-64")
     )
     # slug is a unique identifier for the range, automatically generated from the name.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     # info is a text field for additional information about the range.
     info = models.TextField(
         null=True,
@@ -2390,9 +2561,6 @@ class Range(BaseModel):
 
     def __str__(self):
        return self.name
-
-    def __unicode__(self):
-       return self.name
     
 class RangeRound(BaseModel):
     """
@@ -2400,7 +2568,7 @@ class RangeRound(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the RangeRound model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # range is a foreign key to the Range model, indicating which range is being associated with the round.
     range = models.ForeignKey(
         Range,
@@ -2435,12 +2603,7 @@ class RangeRound(BaseModel):
         """ Returns a string representation of the RangeRound instance.
         This representation includes the range and round names.
         """
-        return f"{str(self.range)} - {str(self.round)}"
-    def __unicode__(self):
-        """ Returns a unicode representation of the RangeRound instance.
-        This representation includes the range and round names.
-        """
-        return f"{str(self.range)} - {str(self.round)}"
+        return f"{self.range} - {self.round}"
 
 class Score(BaseModel):
     """
@@ -2448,7 +2611,7 @@ class Score(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the Score model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # archer is a foreign key to the Archer model, indicating which archer scored the points.
     archer = models.ForeignKey(
         Archer,
@@ -2490,16 +2653,13 @@ class Score(BaseModel):
     def __str__(self):
        return f"{self.archer} - {self.round} - {self.score}"
 
-    def __unicode__(self):
-       return f"{self.archer} - {self.round} - {self.score}"
-
 class ScoreMembership(BaseModel):
     """
     Model representing the relationship between a score and an archer.
     """
 
     # id is a UUID field that serves as the primary key for the ScoreMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # score is a foreign key to the Score model, indicating which score is being associated with the archer.
     score = models.ForeignKey(
         Score,
@@ -2537,14 +2697,7 @@ class ScoreMembership(BaseModel):
         Returns a string representation of the ScoreMembership instance.
         This representation includes the archer and score details.
         """
-        return f"{str(self.archer)} - {str(self.score)}"
-
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the ScoreMembership instance.
-        This representation includes the archer and score details.
-        """
-        return f"{str(self.archer)} - {str(self.score)}"
+        return f"{self.archer} - {self.score}"
 
 class CompetitionScore(BaseModel):
     """
@@ -2552,7 +2705,7 @@ class CompetitionScore(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the CompetitionScore model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # competition is a foreign key to the Competition model, indicating which competition the score belongs to.
     competition = models.ForeignKey(
         Competition,
@@ -2587,16 +2740,13 @@ class CompetitionScore(BaseModel):
     def __str__(self):
        return f"{self.competition} - {self.archer} - {self.score}"
 
-    def __unicode__(self):
-       return f"{self.competition} - {self.archer} - {self.score}"
-
 class ClubChampionship(BaseModel):
     """
     Model representing a club championship, which is a competition within a club.
     """
 
     # id is a UUID field that serves as the primary key for the ClubChampionship model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the club championship, which describes the championship type.
     name = models.CharField(
         max_length=64,
@@ -2607,7 +2757,7 @@ class ClubChampionship(BaseModel):
         help_text=_("format: required, max-64")
     )
     # slug is a unique identifier for the club championship, automatically generated from the name.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     # info is a text field for additional information about the club championship.
     info = models.TextField(
         null=True,
@@ -2631,16 +2781,13 @@ class ClubChampionship(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class ClubChampionshipMembership(BaseModel):
     """
     Model representing the relationship between a club championship and an archer.
     """
 
     # id is a UUID field that serves as the primary key for the ClubChampionshipMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # clubchampionship is a foreign key to the ClubChampionship model, indicating which championship is being participated in.
     clubchampionship = models.ForeignKey(
         ClubChampionship,
@@ -2676,13 +2823,7 @@ class ClubChampionshipMembership(BaseModel):
         Returns a string representation of the ClubChampionshipMembership instance.
         This representation includes the archer and club championship names.
         """
-        return f"{str(self.archer)} - {str(self.clubchampionship)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the ClubChampionshipMembership instance.
-        This representation includes the archer and club championship names.
-        """
-        return f"{str(self.archer)} - {str(self.clubchampionship)}"
+        return f"{self.archer} - {self.clubchampionship}"
 
 class ClubChampionshipScore(BaseModel):
     """
@@ -2690,7 +2831,7 @@ class ClubChampionshipScore(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the ClubChampionshipScore model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # clubchampionship is a foreign key to the ClubChampionship model, indicating which championship the score belongs to.
     clubchampionship = models.ForeignKey(
         ClubChampionship,
@@ -2722,8 +2863,6 @@ class ClubChampionshipScore(BaseModel):
        verbose_name_plural = _("Club Championship Scores")
     def __str__(self):
        return f"{self.clubchampionship} - {self.archer} - {self.score}"
-    def __unicode__(self):
-       return f"{self.clubchampionship} - {self.archer} - {self.score}"
 
 class PersonalBest(BaseModel):
     """
@@ -2731,7 +2870,7 @@ class PersonalBest(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the PersonalBest model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # archer is a foreign key to the Archer model, indicating which archer achieved the personal best.
     archer = models.ForeignKey(
         Archer,
@@ -2765,8 +2904,6 @@ class PersonalBest(BaseModel):
 
     def __str__(self):
        return f"{self.archer} - {self.competition} - {self.score}"
-    def __unicode__(self):
-       return f"{self.archer} - {self.competition} - {self.score}"
 
 class PersonalBestMembership(BaseModel):
     """
@@ -2774,7 +2911,7 @@ class PersonalBestMembership(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the PersonalBestMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
 
     # personalbest is a foreign key to the PersonalBest model, indicating which personal best is being associated with the archer.
     personalbest = models.ForeignKey(
@@ -2801,7 +2938,7 @@ class BestOfClub(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the BestOfClub model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # archer is a foreign key to the Archer model, indicating which archer achieved the best score.
     archer = models.ForeignKey(
         Archer,
@@ -2825,15 +2962,13 @@ class BestOfClub(BaseModel):
        verbose_name_plural = _("Best of Clubs")
     def __str__(self):
        return f"{self.archer} - {self.score}"
-    def __unicode__(self):
-       return f"{self.archer} - {self.score}"
 class BestOfClubMembership(BaseModel):
     """
     Model representing the relationship between a best of club and an archer.
     """
 
     # id is a UUID field that serves as the primary key for the BestOfClubMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bestofclub is a foreign key to the BestOfClub model, indicating which best of club is being associated with the archer.
     bestofclub = models.ForeignKey(
         BestOfClub,
@@ -2869,13 +3004,7 @@ class BestOfClubMembership(BaseModel):
         Returns a string representation of the BestOfClubMembership instance.
         This representation includes the archer and best of club details.
         """
-        return f"{str(self.archer)} - {str(self.bestofclub)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BestOfClubMembership instance.
-        This representation includes the archer and best of club details.
-        """
-        return f"{str(self.archer)} - {str(self.bestofclub)}"
+        return f"{self.archer} - {self.bestofclub}"
 
 class Accessory(BaseModel):
     """
@@ -2883,7 +3012,7 @@ class Accessory(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the Accessory model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the accessory, which describes the accessory type.
     name = models.CharField(
         max_length=64,
@@ -2894,7 +3023,7 @@ class Accessory(BaseModel):
         help_text=_("format: required, max-64")
     )
     # slug is a unique identifier for the accessory, automatically generated from the name.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     # info is a text field for additional information about the accessory.
     info = models.TextField(
         null=True,
@@ -2918,9 +3047,6 @@ class Accessory(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class ArcherAccessory(BaseModel):
     """
     Model representing the relationship between an archer and an accessory.
@@ -2928,7 +3054,7 @@ class ArcherAccessory(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the ArcherAccessory model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # accessory is a foreign key to the Accessory model, indicating which accessory is being used by the archer.
     accessory = models.ForeignKey(
         Accessory,
@@ -2966,13 +3092,7 @@ class ArcherAccessory(BaseModel):
         Returns a string representation of the ArcherAccessory instance.
         This representation includes the archer and accessory names.
         """
-        return f"{str(self.archer)} - {str(self.accessory)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the ArcherAccessory instance.
-        This representation includes the archer and accessory names.
-        """
-        return f"{str(self.archer)} - {str(self.accessory)}"
+        return f"{self.archer} - {self.accessory}"
 
 class ArcherAccessoryMembership(BaseModel):
     """
@@ -2981,7 +3101,7 @@ class ArcherAccessoryMembership(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the ArcherAccessoryMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # archeraccessory is a foreign key to the ArcherAccessory model, indicating which accessory is being associated with the archer.
     archeraccessory = models.ForeignKey(
         ArcherAccessory,
@@ -3019,20 +3139,15 @@ class ArcherAccessoryMembership(BaseModel):
         Returns a string representation of the ArcherAccessoryMembership instance.
         This representation includes the archer and accessory names.
         """
-        return f"{str(self.archer)} - {str(self.archeraccessory)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the ArcherAccessoryMembership instance.
-        This representation includes the archer and accessory names.
-        """
-        return f"{str(self.archer)} - {str(self.archeraccessory)}"
+        return f"{self.archer} - {self.archeraccessory}"
+
 class BowSightAccessory(BaseModel):
     """
     Model representing the relationship between a bow sight and an accessory.
     This model is used to track which accessories are associated with which bow sights.
     """
     # id is a UUID field that serves as the primary key for the BowSightAccessory model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bowsight is a foreign key to the BowSight model, indicating which bow sight is being associated with the accessory.
     bowsight = models.ForeignKey(
         BowSight,
@@ -3070,13 +3185,8 @@ class BowSightAccessory(BaseModel):
         Returns a string representation of the BowSightAccessory instance.
         This representation includes the bow sight and accessory names.
         """
-        return f"{str(self.bowsight)} - {str(self.accessory)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BowSightAccessory instance.
-        This representation includes the bow sight and accessory names.
-        """
-        return f"{str(self.bowsight)} - {str(self.accessory)}"
+        return f"{self.bowsight} - {self.accessory}"
+
 class BowSightAccessoryMembership(BaseModel):
     """
     Model representing the relationship between a bow sight accessory and an archer.
@@ -3084,7 +3194,7 @@ class BowSightAccessoryMembership(BaseModel):
     model is used to track which archers are associated with which bow sight accessories.
     """
     # id is a UUID field that serves as the primary key for the BowSightAccessoryMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bowsightaccessory is a foreign key to the BowSightAccessory model, indicating which bow sight accessory is being associated with the archer.
     bowsightaccessory = models.ForeignKey(
         BowSightAccessory,
@@ -3122,14 +3232,7 @@ class BowSightAccessoryMembership(BaseModel):
         Returns a string representation of the BowSightAccessoryMembership instance.
         This representation includes the archer and bow sight accessory names.
         """
-        return f"{str(self.archer)} - {str(self.bowsightaccessory)}"
-
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BowSightAccessoryMembership instance.
-        This representation includes the archer and bow sight accessory names.
-        """
-        return f"{str(self.archer)} - {str(self.bowsightaccessory)}"
+        return f"{self.archer} - {self.bowsightaccessory}"
 
 class Bow(BaseModel):
     """
@@ -3137,7 +3240,7 @@ class Bow(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the Bow model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the bow, which describes the bow type.
     name = models.CharField(
         max_length=64,
@@ -3148,7 +3251,7 @@ class Bow(BaseModel):
         help_text=_("format: required, max-64")
     )
     # slug is a unique identifier for the bow, automatically generated from the name.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     # info is a text field for additional information about the bow.
     info = models.TextField(
         null=True,
@@ -3169,8 +3272,6 @@ class Bow(BaseModel):
        verbose_name_plural = _("Bows")
     def __str__(self):
        return self.name
-    def __unicode__(self):
-       return self.name
 class BowMembership(BaseModel):
     """
     Model representing the relationship between a bow and an archer.
@@ -3178,7 +3279,7 @@ class BowMembership(BaseModel):
     model is used to track which bows are used by which archers.
     """
     # id is a UUID field that serves as the primary key for the BowMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bow is a foreign key to the Bow model, indicating which bow is being used by the archer.
     bow = models.ForeignKey(
         Bow,
@@ -3216,14 +3317,7 @@ class BowMembership(BaseModel):
         Returns a string representation of the BowMembership instance.
         This representation includes the archer and bow names.
         """
-        return f"{str(self.archer)} - {str(self.bow)}"
-
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BowMembership instance.
-        This representation includes the archer and bow names.
-        """
-        return f"{str(self.archer)} - {str(self.bow)}"
+        return f"{self.archer} - {self.bow}"
 
 class BowAccessory(BaseModel):
     pass
\ No newline at end of file
@@ -93,6 +93,13 @@ class ClubCreateSerializer(serializers.ModelSerializer):
     id = serializers.UUIDField(read_only=True)
     memberships = MembershipSerializer(many=True, required=False)
 
+    def validate_memberships(self, value):
+        # (club, archer) is unique, a repeated archer would fail on insert
+        archers = [membership['archer'] for membership in value]
+        if len(set(archers)) != len(archers):
+            raise serializers.ValidationError("An archer can only be listed once.")
+        return value
+
     def update(self, instance, validated_data):
         membership_data = validated_data.pop('memberships')
 
@@ -101,8 +108,13 @@ class ClubCreateSerializer(serializers.ModelSerializer):
 
             if membership_data is not None:
                 instance.memberships.all().delete()
-                for membership in membership_data:
-                    Membership.objects.create(club=instance, **membership)
+                Membership.objects.bulk_create(
+                    [
+                        Membership(club=instance, **membership)
+                        for membership in membership_data
+                    ],
+                    batch_size=500,
+                )
 
         return instance
 
@@ -111,8 +123,10 @@ class ClubCreateSerializer(serializers.ModelSerializer):
 
         with transaction.atomic():
             club = Club.objects.create(**validated_data)
-            for membership in membership_data:
-                Membership.objects.create(club=club, **membership)
+            Membership.objects.bulk_create(
+                [Membership(club=club, **membership) for membership in membership_data],
+                batch_size=500,
+            )
 
         return club
 
@@ -146,6 +160,33 @@ class ClubSerializer(serializers.ModelSerializer):
             'memberships'
         )
 
+class ArcherRowSerializer(serializers.Serializer):
+    """
+    Read-only serializer for the dict rows of Archer.objects.api_list().
+    It renders the same output as ArcherSerializer.
+    """
+    id = serializers.UUIDField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    modified_at = serializers.DateTimeField(read_only=True)
+    last_name = serializers.CharField(read_only=True)
+    first_name = serializers.CharField(read_only=True)
+    middle_name = serializers.CharField(read_only=True)
+    union_number = serializers.IntegerField(read_only=True)
+    info = serializers.CharField(read_only=True)
+    author = serializers.IntegerField(read_only=True)
+
+class LeaderboardRowSerializer(serializers.Serializer):
+    """
+    Read-only serializer for the dict rows of Result.objects.leaderboard().
+    It renames the archer lookups to plain keys.
+    """
+    archer = serializers.UUIDField(read_only=True)
+    last_name = serializers.CharField(source='archer__last_name', read_only=True)
+    first_name = serializers.CharField(source='archer__first_name', read_only=True)
+    score_total = serializers.IntegerField(read_only=True)
+    arrow_total = serializers.IntegerField(read_only=True)
+    score_average = serializers.FloatField(read_only=True)
+
 class ArcherInfoSerializer(serializers.Serializer):
-    archers = ArcherSerializer(many=True, read_only=True)
+    archers = ArcherRowSerializer(many=True, read_only=True)
     count = serializers.IntegerField(read_only=True)
@@ -1,3 +1,70 @@
-from django.test import TestCase
+import uuid
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, modify_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from api.models import Archer, Contest, Result, User
+
+
+# silk stores every request in the database, which would be counted too
+@modify_settings(MIDDLEWARE={'remove': 'silk.middleware.SilkyMiddleware'})
+class ContestLeaderboardTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='tester', password='test')
+        cls.contest = Contest.objects.create(name='Indoor', author=cls.user)
+        cls.jansen = Archer.objects.create(last_name='Jansen', first_name='Piet', author=cls.user)
+        cls.smulders = Archer.objects.create(last_name='Smulders', first_name='Harrie', author=cls.user)
+        cls.result = Result.objects.create(
+            archer=cls.jansen, contest=cls.contest, score=240, arrows=30, author=cls.user
+        )
+        Result.objects.create(
+            archer=cls.smulders, contest=cls.contest, score=270, arrows=30, author=cls.user
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse('contest-leaderboard', args=[self.contest.pk])
+
+    def test_rows_use_plain_keys_best_average_first(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [
+            {
+                'archer': str(self.smulders.pk),
+                'last_name': 'Smulders',
+                'first_name': 'Harrie',
+                'score_total': 270,
+                'arrow_total': 30,
+                'score_average': 9.0,
+            },
+            {
+                'archer': str(self.jansen.pk),
+                'last_name': 'Jansen',
+                'first_name': 'Piet',
+                'score_total': 240,
+                'arrow_total': 30,
+                'score_average': 8.0,
+            },
+        ])
+
+    def test_cached_rows_skip_the_leaderboard_query(self):
+        self.client.get(self.url)
+        # the contest and the version aggregate only
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+        self.assertEqual(response.json()[0]['last_name'], 'Smulders')
+
+    def test_record_score_rebuilds_the_rows(self):
+        self.client.get(self.url)
+        self.result.record_score(290, 30)
+        rows = self.client.get(self.url).json()
+        self.assertEqual(rows[0]['last_name'], 'Jansen')
+        self.assertEqual(rows[0]['score_total'], 290)
+
+    def test_unknown_contest_is_404(self):
+        response = self.client.get(reverse('contest-leaderboard', args=[uuid.uuid4()]))
+        self.assertEqual(response.status_code, 404)
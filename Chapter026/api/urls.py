@@ -7,6 +7,7 @@ urlpatterns = [
     path('archers/', views.ArcherListCreateAPIView.as_view(), name='archer-list'),
     path('archers/info/', views.ArcherInfoAPIView.as_view(), name='archer-info'),
     path('archers/<uuid:archer_id>/', views.ArcherDetailAPIView.as_view(), name='archer-detail'),
+    path('contests/<uuid:contest_id>/leaderboard/', views.ContestLeaderboardAPIView.as_view(), name='contest-leaderboard'),
     path('users/', views.UserListView.as_view(), name='user_list'),
 ]
 
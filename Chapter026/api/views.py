@@ -1,3 +1,5 @@
+from django.core.cache import cache
+from django.db.models import Count, Max
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend  # type: ignore
 from rest_framework import filters, generics, viewsets
@@ -9,10 +11,10 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from api.filters import ArcherFilter, ClubFilter
-from api.models import Archer, Club, User
+from api.models import Archer, Club, Contest, Result, User
 from api.serializers import (ArcherInfoSerializer, ArcherSerializer,
                              ClubSerializer, ClubCreateSerializer,
-                             UserSerializer)
+                             LeaderboardRowSerializer, UserSerializer)
 
 class ArcherListCreateAPIView(generics.ListCreateAPIView):
     queryset = Archer.objects.order_by('pk')
@@ -50,7 +52,7 @@ class ArcherDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
         return super().get_permissions()
 
 class ClubViewSet(viewsets.ModelViewSet):
-    queryset = Club.objects.prefetch_related('memberships__archer').order_by('name')
+    queryset = Club.objects.with_members().order_by('name')
     serializer_class = ClubSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = None
@@ -66,13 +68,33 @@ class ClubViewSet(viewsets.ModelViewSet):
 
 class ArcherInfoAPIView(APIView):
     def get(self, request):
-        archers = Archer.objects.all()
+        archers = Archer.objects.api_list()
         serializer = ArcherInfoSerializer({
             'archers': archers,
             'count': len(archers),
         })
         return Response(serializer.data)
 
+class ContestLeaderboardAPIView(APIView):
+    def get(self, request, contest_id):
+        contest = get_object_or_404(Contest, pk=contest_id)
+        # any insert, update or delete of a result of the contest changes
+        # the key, the timeout bounds how long archer renames stay stale
+        version = Result.objects.filter(contest=contest).aggregate(
+            count=Count('pk'), modified=Max('modified_at')
+        )
+        modified = version['modified']
+        key = 'leaderboard:{}:{}:{}'.format(
+            contest.pk, version['count'], modified.isoformat() if modified else ''
+        )
+        return Response(cache.get_or_set(key, lambda: self.rows(contest), 60))
+
+    def rows(self, contest):
+        serializer = LeaderboardRowSerializer(
+            Result.objects.leaderboard(contest), many=True
+        )
+        return serializer.data
+
 class UserListView(generics.ListAPIView):
     queryset = User.objects.all()
     serializer_class = UserSerializer
@@ -71,12 +71,13 @@ class Command(BaseCommand):
         Club.objects.bulk_create(clubs)
         clubs = Club.objects.all()
         
-        for archer in archers:
-           for club in clubs:
-               Membership.objects.create(
-                   archer=archer,
-                   club=club,
-                   start_date="2023-01-01",
-                   end_date="2023-12-31",
-               )
-
+        Membership.bulk_import(
+            dict(
+                archer=archer,
+                club=club,
+                start_date="2023-01-01",
+                end_date="2023-12-31",
+            )
+            for archer in archers
+            for club in clubs
+        )
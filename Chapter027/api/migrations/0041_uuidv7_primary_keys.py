@@ -0,0 +1,279 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:45
+
+import api.utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0040_alter_accessory_author_alter_archeraccessory_author_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='accessory',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='archer',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='archeraccessory',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='archeraccessorymembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='arrow',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='arrowfletching',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='arrowtype',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='arrowtypemembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bestofclub',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bestofclubmembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bow',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowaccessory',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowaccessorymembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowlimb',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowmembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowriser',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowrisermembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowsight',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowsightaccessory',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowsightaccessorymembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowsightarcher',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowstring',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowtype',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='bowtypemembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='category',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='categorymembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='club',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='clubchampionship',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='clubchampionshipmembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='clubchampionshipscore',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='competition',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='competitionmembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='competitionscore',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='contest',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='contestmembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='distance',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='fletching',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='membership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='personalbest',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='personalbestmembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='range',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='rangeround',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='result',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='resultmembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='round',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='rounddistance',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='roundmembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='score',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='scoremembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='scoringsheet',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='targetface',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='team',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='teammembership',
+            name='id',
+            field=models.UUIDField(default=api.utils.uuidv7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0041_uuidv7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bowtypemembership',
+            index=models.Index(fields=['archer', 'bowtype'], name='btmember_archer_bowtype_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='categorymembership',
+            index=models.Index(fields=['archer', 'category'], name='catmember_archer_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competitionmembership',
+            index=models.Index(fields=['archer', 'competition'], name='compmember_archer_comp_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contestmembership',
+            index=models.Index(fields=['archer', 'contest'], name='ctmember_archer_contest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='membership',
+            index=models.Index(fields=['archer', 'club'], name='membership_archer_club_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='teammembership',
+            index=models.Index(fields=['archer', 'team'], name='teammember_archer_team_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='bowtypemembership',
+            constraint=models.UniqueConstraint(fields=('bowtype', 'archer'), name='bowtypemembership_bowtype_archer_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='categorymembership',
+            constraint=models.UniqueConstraint(fields=('category', 'archer'), name='categorymembership_category_archer_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='competitionmembership',
+            constraint=models.UniqueConstraint(fields=('competition', 'archer'), name='competitionmembership_competition_archer_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='contestmembership',
+            constraint=models.UniqueConstraint(fields=('contest', 'archer'), name='contestmembership_contest_archer_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='membership',
+            constraint=models.UniqueConstraint(fields=('club', 'archer'), name='membership_club_archer_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='teammembership',
+            constraint=models.UniqueConstraint(fields=('team', 'archer'), name='teammembership_team_archer_unique'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.1 on 2026-10-15 22:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0042_membership_constraints'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='archer',
+            index=models.Index(fields=['last_name', 'first_name'], name='archer_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='archer',
+            index=models.Index(condition=models.Q(('email__isnull', False)), fields=['email'], name='archer_email_idx'),
+        ),
+    ]
@@ -0,0 +1,129 @@
+# Generated by Django 5.1.1 on 2026-10-15 23:11
+
+import django_extensions.db.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0043_archer_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='accessory',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='archer',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='last_name'),
+        ),
+        migrations.AlterField(
+            model_name='arrow',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='arrowtype',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='bow',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='bowlimb',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='bowriser',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='bowsight',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='bowstring',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='bowtype',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='category',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='club',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='clubchampionship',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='competition',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='contest',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='distance',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='fletching',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='range',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='result',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='score'),
+        ),
+        migrations.AlterField(
+            model_name='round',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='scoringsheet',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='targetface',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+        migrations.AlterField(
+            model_name='team',
+            name='slug',
+            field=django_extensions.db.fields.AutoSlugField(allow_duplicates=True, blank=True, editable=False, populate_from='name'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.1 on 2026-10-15 23:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0044_slug_allow_duplicates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='club',
+            index=models.Index(fields=['created_at'], name='club_created_at_idx'),
+        ),
+    ]
@@ -1,11 +1,13 @@
-import uuid
 from django.utils import timezone
 from django.db import models
+from django.db.models import Prefetch, Q
 from django.contrib.auth.models import AbstractUser
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django_extensions.db.fields import AutoSlugField
 
+from api.utils import uuidv7
+
 class User(AbstractUser):
     """
     Custom user model that extends the default Django user model.
@@ -57,6 +59,34 @@ class BaseModel(models.Model):
 
         abstract = True
 
+class SelectRelatedManager(models.Manager):
+    """
+    Manager that joins the given foreign keys on every query.
+    Used by models whose string representation follows those keys,
+    so listing them does not cost one query per row and relation.
+    Subclasses name the keys in related. They are class attributes because
+    Django builds reverse and related managers by subclassing the default
+    manager and instantiating it without arguments.
+    """
+
+    related = ()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # an empty select_related() would follow every foreign key
+        if self.related:
+            queryset = queryset.select_related(*self.related)
+        return queryset
+
+class MembershipManager(SelectRelatedManager):
+    related = ('club', 'archer')
+
+class CategoryMembershipManager(SelectRelatedManager):
+    related = ('category', 'archer')
+
+class BowTypeMembershipManager(SelectRelatedManager):
+    related = ('bowtype', 'archer')
+
 class Archer(BaseModel):
     """
     Model representing an archer.
@@ -65,34 +95,16 @@ class Archer(BaseModel):
     The Archer model inherits from BaseModel to include common fields for tracking creation and modification timestamps.
     """
 
-    def __init__(self, *args, **kwargs):
-        """
-        Initialize the Archer model and set up the slug field to be generated from the last_name field.
-        This method is called when an instance of the Archer model is created.
-        It allows for customization of the model's initialization process.
-        Args:
-            *args: Variable length argument list.
-            **kwargs: Arbitrary keyword arguments.
-        """
-
-        # Call the parent class's __init__ method to ensure proper initialization.
-        # This is necessary to ensure that the model is set up correctly.
-        # This allows the slug field to be automatically generated based on the last_name field.
-        # The populate_from argument specifies that the slug should be generated from the last_name field.
-        # This is useful for creating URL-friendly representations of the archer's name.
-        super().__init__(*args, **kwargs)
-        self._meta.get_field('slug').populate_from = 'last_name'
-
     # id is a UUID field that serves as the primary key for the Archer model.
     # It is automatically generated and not editable.
     # This ensures that each archer has a unique identifier.
     # UUIDField is used to generate a universally unique identifier for each archer.
     # This is useful for ensuring that each archer can be uniquely identified across the application.
-    # The default value is set to uuid.uuid4(), which generates a new UUID each time a new archer is created.
+    # The default value is set to uuidv7(), which generates a new time-ordered UUID each time a new archer is created.
     # This is useful for database management and migrations.
     # It allows for easy identification of the archer in the database.
     # The id field is not editable, meaning it cannot be changed after the archer is created.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
 
     # last_name is a CharField that stores the last name of the archer.
     # It is required and cannot be blank.
@@ -151,7 +163,7 @@ class Archer(BaseModel):
     # The slug is generated from the last_name field, ensuring that it is always based on the archer's last name.
     # This allows for easy identification of the archer in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='last_name',editable=True)
+    slug = AutoSlugField(populate_from='last_name',editable=True,allow_duplicates=True)
 
     # union_number is a PositiveIntegerField that stores the union number of the archer.
     # It is not required and can be blank.
@@ -343,6 +355,19 @@ class Archer(BaseModel):
         # This is useful for displaying lists of archers in a user-friendly manner.
         ordering = ['last_name']
 
+        # Composite index matching the default ordering and name lookups,
+        # so sorted archer lists can be read from the index in order.
+        # Email is optional, so its index only covers rows that have one.
+        # union_number needs no extra index: it is unique, which already indexes it.
+        indexes = [
+            models.Index(fields=['last_name', 'first_name'], name='archer_name_idx'),
+            models.Index(
+                fields=['email'],
+                name='archer_email_idx',
+                condition=Q(email__isnull=False),
+            ),
+        ]
+
         # verbose_name is the singular name for the Archer model.
         # This is used in the Django admin interface and other places where a singular name is needed.
         # It provides a human-readable name for the model.
@@ -373,20 +398,22 @@ class Archer(BaseModel):
             s_middle_name = self.middle_name
         return f"{self.last_name} {self.first_name} {s_middle_name}"
 
-    def __unicode__(self):
-        """
-        Return a unicode representation of the Archer model.
-        This method is used to provide a human-readable representation of the archer's name.
-        The unicode representation is useful for displaying the archer's name in lists and other contexts.
-        """
+class ClubQuerySet(models.QuerySet):
+    """
+    QuerySet for the Club model.
+    with_members() loads the memberships of every club, with their
+    archers, in one extra query instead of one query per club.
+    """
 
-        # If middle_name is provided, include it in the unicode representation.
-        # This allows for a more complete representation of the archer's name.
-        # The unicode representation is useful for displaying the archer's name in lists and other contexts.
-        s_middle_name = ""
-        if self.middle_name:
-            s_middle_name = self.middle_name
-        return f"{self.last_name} {self.first_name} {s_middle_name}"
+    def with_members(self):
+        # The club of each membership is the prefetching club itself,
+        # so only the archer is joined.
+        return self.prefetch_related(
+            Prefetch(
+                'memberships',
+                queryset=Membership.objects.select_related(None).select_related('archer'),
+            )
+        )
 
 class Club(BaseModel):
     """
@@ -398,31 +425,13 @@ class Club(BaseModel):
     The Club model is used to represent an archery club, which can have multiple archers associated with it.
     """
 
-    def __init__(self, *args, **kwargs):
-        """
-        Initialize the Club model and set up the slug field to be generated from the name field.
-        This method is called when an instance of the Club model is created.
-        It allows for customization of the model's initialization process.
-        Args:
-            *args: Variable length argument list.
-            **kwargs: Arbitrary keyword arguments.
-        """
-
-        # Call the parent class's __init__ method to ensure proper initialization.
-        # This is necessary to ensure that the model is set up correctly.
-        # This allows the slug field to be automatically generated based on the name field.
-        # The populate_from argument specifies that the slug should be generated from the name field.
-        # This is useful for creating URL-friendly representations of the club.
-        super().__init__(*args, **kwargs)
-        self._meta.get_field('slug').populate_from = 'name'
-
     # id is a UUID field that serves as the primary key for the Club model.
     # It is automatically generated and not editable.
     # This ensures that each club has a unique identifier.
     # UUIDField is used to generate a universally unique identifier for each club.
     # This is useful for ensuring that each club can be uniquely identified across the application.
-    # The default value is set to uuid.uuid4(), which generates a new UUID each time a new club is created.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # The default value is set to uuidv7(), which generates a new time-ordered UUID each time a new club is created.
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
 
     # name is a CharField that stores the name of the club.
     # It is required and cannot be blank.
@@ -448,7 +457,7 @@ class Club(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the club's name.
     # This allows for easy identification of the club in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     # address is a CharField that stores the address of the club.
     # It is not required and can be blank.
@@ -659,6 +668,12 @@ class Club(BaseModel):
         # This is useful for displaying lists of clubs in a user-friendly manner.
         verbose_name_plural = _("Clubs")
 
+        # ClubFilter offers created_at__lt/__gt, which can range-scan this
+        # index instead of reading the whole table.
+        indexes = [
+            models.Index(fields=['created_at'], name='club_created_at_idx'),
+        ]
+
     def __str__(self):
         """
         Return a string representation of the Club model.
@@ -668,14 +683,7 @@ class Club(BaseModel):
 
         return self.name
 
-    def __unicode__(self):
-        """
-        Return a unicode representation of the Club model.
-        This method is used to provide a human-readable representation of the club's name.
-        The unicode representation is useful for displaying the club's name in lists and other contexts.
-        """
-        
-        return self.name
+    objects = ClubQuerySet.as_manager()
 
 class Membership(BaseModel):
     """
@@ -688,27 +696,13 @@ class Membership(BaseModel):
     It allows for tracking the relationship between archers and clubs, including start and end dates of the membership.
     """
 
-    def __init__(self, *args, **kwargs):
-        """
-        Initialize the Membership model.
-        This method is called when an instance of the Membership model is created.
-        It allows for customization of the model's initialization process.
-        Args:
-            *args: Variable length argument list.
-            **kwargs: Arbitrary keyword arguments.
-        """
-
-        # Call the parent class's __init__ method to ensure proper initialization.
-        # This is necessary to ensure that the model is set up correctly.
-        super().__init__(*args, **kwargs)
-        
     # id is a UUID field that serves as the primary key for the Membership model.
     # It is automatically generated and not editable.
     # This ensures that each membership has a unique identifier.
     # UUIDField is used to generate a universally unique identifier for each membership.
     # This is useful for ensuring that each membership can be uniquely identified across the application.
-    # The default value is set to uuid.uuid4(), which generates a new UUID each time a new membership is created.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # The default value is set to uuidv7(), which generates a new time-ordered UUID each time a new membership is created.
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
 
     # club is a ForeignKey that links the Membership model to the Club model.
     # It uses PROTECT to prevent deletion of the club if there are memberships linked to it.
@@ -811,6 +805,19 @@ class Membership(BaseModel):
 
     # Extra fields for membership information end
 
+    # __str__ follows archer and club, so they are joined by default.
+    objects = MembershipManager()
+
+    @classmethod
+    def bulk_import(cls, rows, batch_size=1000):
+        """Insert memberships from dicts of field values in batches."""
+        # Pairs that already exist are skipped by the (club, archer) unique constraint.
+        return cls.objects.bulk_create(
+            [cls(**row) for row in rows],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+
     class Meta:
         """
         Meta options for the Membership model.
@@ -842,6 +849,19 @@ class Membership(BaseModel):
         # It provides a human-readable name for the model when referring to multiple instances.
         verbose_name_plural = _("Memberships")
 
+        # An archer is a member of a club only once. The unique constraint
+        # also indexes (club, archer) for listing the members of a club,
+        # the reverse index serves listing the clubs of an archer.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['club', 'archer'],
+                name='membership_club_archer_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'club'], name='membership_archer_club_idx'),
+        ]
+
     def __str__(self):
         """
         Return a string representation of the Membership model.
@@ -852,19 +872,7 @@ class Membership(BaseModel):
         # Use the string representation of the archer and club to create a meaningful description.
         # The string representation is useful for displaying the membership in lists and other contexts.
         # This allows for a more complete representation of the membership.
-        return f"{str(self.archer)} - {str(self.club)} {self.club.town}"
-
-    def __unicode__(self):
-        """
-        Return a unicode representation of the Membership model.
-        This method is used to provide a human-readable representation of the membership.
-        The unicode representation is useful for displaying the membership in lists and other contexts.
-        """
-
-        # Use the string representation of the archer and club to create a meaningful description.
-        # The unicode representation is useful for displaying the membership in lists and other contexts.
-        # This allows for a more complete representation of the membership.
-        return f"{str(self.archer)} - {str(self.club)} {self.club.town}"
+        return f"{self.archer} - {self.club} {self.club.town}"
 
 class Category(BaseModel):
     """
@@ -876,34 +884,16 @@ class Category(BaseModel):
     The Category model is used to represent a category that archers can belong to.
     """
 
-    def __init__(self, *args, **kwargs):
-        """
-        Initialize the Category model and set up the slug field to be generated from the name field.
-        This method is called when an instance of the Category model is created.
-        It allows for customization of the model's initialization process.
-        Args:
-            *args: Variable length argument list.
-            **kwargs: Arbitrary keyword arguments.
-        """
-
-        # Call the parent class's __init__ method to ensure proper initialization.
-        # This is necessary to ensure that the model is set up correctly.
-        # This allows the slug field to be automatically generated based on the name field.
-        # The populate_from argument specifies that the slug should be generated from the name field.
-        # This is useful for creating URL-friendly representations of the category.
-        super().__init__(*args, **kwargs)
-        self._meta.get_field('slug').populate_from = 'name'
-        
     # id is a UUID field that serves as the primary key for the Category model.
     # It is automatically generated and not editable.
     # This ensures that each category has a unique identifier.
     # UUIDField is used to generate a universally unique identifier for each category.
     # This is useful for ensuring that each category can be uniquely identified across the application.
-    # The default value is set to uuid.uuid4(), which generates a new UUID each time a new category is created.
+    # The default value is set to uuidv7(), which generates a new time-ordered UUID each time a new category is created.
     # This is usefule for database management and migrations.
     # It allows for easy identification of the table associated with the Category model.
     # The id field is not editable, meaning that it cannot be changed once after the category is created.    
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     
     # name is a CharField that stores the name of the category.
     # It is required and cannot be blank.
@@ -923,7 +913,7 @@ class Category(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the category's name.
     # This allows for easy identification of the category in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     # archers is a ManyToManyField that links the Category model to the Archer model through the CategoryMembership model.
     # This allows multiple archers to be associated with a category and vice versa.
@@ -1011,11 +1001,8 @@ class Category(BaseModel):
     def __str__(self):
         return self.name
 
-    def __unicode__(self):
-        return self.name
-
 class CategoryMembership(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     category = models.ForeignKey(
         Category,
         on_delete=models.PROTECT,
@@ -1033,14 +1020,35 @@ class CategoryMembership(BaseModel):
         related_name='categorymembership_archer'
     )
 
+    objects = CategoryMembershipManager()
+
+    @classmethod
+    def bulk_import(cls, rows, batch_size=1000):
+        """Insert memberships from dicts of field values in batches."""
+        # Pairs that already exist are skipped by the (category, archer) unique constraint.
+        return cls.objects.bulk_create(
+            [cls(**row) for row in rows],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+
     def __str__(self):
-        return f"{str(self.archer)} - {str(self.category)}"
+        return f"{self.archer} - {self.category}"
 
-    def __unicode__(self):
-        return f"{str(self.archer)} - {str(self.category)}"
+    class Meta:
+        # An archer is in a category only once; see Membership.Meta.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['category', 'archer'],
+                name='categorymembership_category_archer_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'category'], name='catmember_archer_category_idx'),
+        ]
 
 class BowType(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1057,7 +1065,7 @@ class BowType(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the bow type's name.
     # This allows for easy identification of the bow type in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     archer = models.ManyToManyField(
         Archer,
@@ -1185,11 +1193,8 @@ class BowType(BaseModel):
     def __str__(self):
         return self.name
 
-    def __unicode__(self):
-        return self.name
-
 class BowTypeMembership(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     bowtype = models.ForeignKey(
         BowType,
         on_delete=models.PROTECT,
@@ -1207,14 +1212,35 @@ class BowTypeMembership(BaseModel):
         related_name='bowtypemembership_archer'
     )
 
+    objects = BowTypeMembershipManager()
+
+    @classmethod
+    def bulk_import(cls, rows, batch_size=1000):
+        """Insert memberships from dicts of field values in batches."""
+        # Pairs that already exist are skipped by the (bowtype, archer) unique constraint.
+        return cls.objects.bulk_create(
+            [cls(**row) for row in rows],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+
     def __str__(self):
-        return f"{str(self.archer)} - {str(self.bowtype)}"
+        return f"{self.archer} - {self.bowtype}"
 
-    def __unicode__(self):
-        return f"{str(self.archer)} - {str(self.bowtype)}"
+    class Meta:
+        # An archer is in a bow type only once; see Membership.Meta.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['bowtype', 'archer'],
+                name='bowtypemembership_bowtype_archer_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'bowtype'], name='btmember_archer_bowtype_idx'),
+        ]
 
 class BowString(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1231,7 +1257,7 @@ class BowString(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the bow string's name.
     # This allows for easy identification of the bow string in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     bowtype = models.ForeignKey(
         BowType,
@@ -1318,11 +1344,8 @@ class BowString(BaseModel):
     def __str__(self):
         return self.name
 
-    def __unicode__(self):
-        return self.name
-
 class BowRiser(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1339,7 +1362,7 @@ class BowRiser(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the bow riser's name.
     # This allows for easy identification of the bow riser in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     bowtype = models.ForeignKey(
         BowType,
@@ -1428,8 +1451,6 @@ class BowRiser(BaseModel):
 
     def __str__(self):
         return self.name
-    def __unicode__(self):
-        return self.name
 
 class BowRiserMembership(BaseModel):
     """
@@ -1438,7 +1459,7 @@ class BowRiserMembership(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the BowRiserMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bowriser is a foreign key to the BowRiser model, indicating which bow riser is being used by the archer.
     bowriser = models.ForeignKey(
         BowRiser,
@@ -1485,17 +1506,10 @@ class BowRiserMembership(BaseModel):
         Returns a string representation of the BowRiserMembership instance.
         This representation includes the archer and bow riser names.
         """
-        return f"{str(self.archer)} - {str(self.bowriser)}"
-
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BowRiserMembership instance.
-        This representation includes the archer and bow riser names.
-        """
-        return f"{str(self.archer)} - {str(self.bowriser)}"
+        return f"{self.archer} - {self.bowriser}"
 
 class BowLimb(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1512,7 +1526,7 @@ class BowLimb(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the bow limb's name.
     # This allows for easy identification of the bow limb in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     bowtype = models.ForeignKey(
         BowType,
@@ -1686,13 +1700,13 @@ class BowLimb(BaseModel):
         verbose_name_plural = _("Bow Limbs")
 
     def __str__(self):
-       return
+        return self.name
 
 class Team(BaseModel):
     '''Model representing a team of archers.'''
 
     '''id is a UUID field that serves as the primary key for the Team model.'''
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1709,7 +1723,7 @@ class Team(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the team's name.
     # This allows for easy identification of the team in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     '''archer is a many-to-many relationship with the Archer model, allowing multiple archers to be part of a team.'''
     archer = models.ManyToManyField(
@@ -1760,12 +1774,8 @@ class Team(BaseModel):
         '''Returns the name of the team.'''
         return self.name
 
-    def __unicode__(self):
-        '''Returns the name of the team in unicode format.'''
-        return self.name
-
 class TeamMembership(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     team = models.ForeignKey(
         Team,
         on_delete=models.PROTECT,
@@ -1783,14 +1793,35 @@ class TeamMembership(BaseModel):
         related_name='teammembership_archer'
     )
 
+    @classmethod
+    def bulk_enroll(cls, team, archers):
+        """Enroll archers in the team in batches, skipping current members."""
+        # The (team, archer) unique constraint turns rows that already exist,
+        # repeated archers and concurrent enrolments into no-ops.
+        return cls.objects.bulk_create(
+            [cls(team=team, archer=archer) for archer in archers],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
     def __str__(self):
-        return f"{str(self.archer)} - {str(self.team)}"
+        return f"{self.archer} - {self.team}"
 
-    def __unicode__(self):
-        return f"{str(self.archer)} - {str(self.team)}"
+    class Meta:
+        # Same layout as Membership: the unique constraint indexes
+        # (team, archer), the reverse index serves the teams of an archer.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['team', 'archer'],
+                name='teammembership_team_archer_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'team'], name='teammember_archer_team_idx'),
+        ]
 
 class Contest(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1807,7 +1838,7 @@ class Contest(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the contest's name.
     # This allows for easy identification of the contest in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     archer = models.ManyToManyField(
         Archer,
@@ -1915,11 +1946,8 @@ class Contest(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class ContestMembership(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     contest = models.ForeignKey(
         Contest,
         on_delete=models.PROTECT,
@@ -1937,11 +1965,32 @@ class ContestMembership(BaseModel):
         related_name='contestmembership_archer'
     )
 
+    @classmethod
+    def bulk_enroll(cls, contest, archers):
+        """Enroll archers in the contest in batches, skipping current members."""
+        # The (contest, archer) unique constraint turns rows that already exist,
+        # repeated archers and concurrent enrolments into no-ops.
+        return cls.objects.bulk_create(
+            [cls(contest=contest, archer=archer) for archer in archers],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
     def __str__(self):
-        return f"{str(self.archer)} - {str(self.contest)}"
+        return f"{self.archer} - {self.contest}"
 
-    def __unicode__(self):
-        return f"{str(self.archer)} - {str(self.contest)}"
+    class Meta:
+        # Same layout as Membership: the unique constraint indexes
+        # (contest, archer), the reverse index serves the contests of an archer.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['contest', 'archer'],
+                name='contestmembership_contest_archer_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'contest'], name='ctmember_archer_contest_idx'),
+        ]
 
 TARGET_DIAMETERS = (
     ("40 cm", "40 cm"),
@@ -1951,7 +2000,7 @@ TARGET_DIAMETERS = (
 )
 
 class TargetFace(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -1968,7 +2017,7 @@ class TargetFace(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the target face's name.
     # This allows for easy identification of the target face in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     diameter = models.CharField (
         null=False,
         unique=False,
@@ -2018,16 +2067,13 @@ class TargetFace(BaseModel):
     def __str__(self):
         return f"{self.name} ( {self.diameter} )"
 
-    def __unicode__(self):
-        return f"{self.name} ( {self.diameter} )"
-
 SHEET_DIMENSIONS = (
     ("10x3", "10x3"),
     ("5x5", "5x5"),
 )
 
 class ScoringSheet(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -2044,7 +2090,7 @@ class ScoringSheet(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the scoring sheet's name.
     # This allows for easy identification of the scoring sheet in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     dimension = models.CharField (
         null=True,
@@ -2095,11 +2141,8 @@ class ScoringSheet(BaseModel):
     def __str__(self):
         return f"{self.name} ( {self.dimension} )"
 
-    def __unicode__(self):
-        return f"{self.name} ( {self.dimension} )"
-
 class Result(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     archer=models.ForeignKey(
         Archer,
         on_delete=models.PROTECT,
@@ -2156,7 +2199,7 @@ class Result(BaseModel):
     # The slug is generated from the score field, ensuring that it is always based on the result's score.
     # This allows for easy identification of the result in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='score',editable=True)
+    slug = AutoSlugField(populate_from='score',editable=True,allow_duplicates=True)
 
     arrows=models.PositiveSmallIntegerField(
         default=0,
@@ -2213,9 +2256,6 @@ class Result(BaseModel):
     def __str__(self):
         return str(self.score)
 
-    def __unicode__(self):
-        return str(self.score)
-
     @property
     def average(self):
         result = None
@@ -2233,7 +2273,7 @@ class ResultMembership(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the ScoreMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # archer is a foreign key to the Archer model, indicating which archer achieved the score.
     archer = models.ForeignKey(
         Archer,
@@ -2262,16 +2302,10 @@ class ResultMembership(BaseModel):
        Returns a string representation of the ScoreMembership instance.
        This representation includes the archer and score details.
        """
-       return f"{str(self.archer)} - {str(self.score)}"
-    def __unicode__(self):
-       """
-       Returns a unicode representation of the ScoreMembership instance.
-       This representation includes the archer and score details.
-       """
-       return f"{str(self.archer)} - {str(self.score)}"
+       return f"{self.archer} - {self.score}"
 
 class Competition(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -2288,7 +2322,7 @@ class Competition(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the competition's name.
     # This allows for easy identification of the competition in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     archer = models.ManyToManyField(
         Archer,
@@ -2399,11 +2433,8 @@ class Competition(BaseModel):
     def __str__(self):
         return self.name
 
-    def __unicode__(self):
-        return self.name
-
 class CompetitionMembership(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     competition = models.ForeignKey(
         Competition,
         on_delete=models.PROTECT,
@@ -2421,14 +2452,35 @@ class CompetitionMembership(BaseModel):
         related_name='competitionmembership_archer'
     )
 
+    @classmethod
+    def bulk_enroll(cls, competition, archers):
+        """Enroll archers in the competition in batches, skipping current members."""
+        # The (competition, archer) unique constraint turns rows that already exist,
+        # repeated archers and concurrent enrolments into no-ops.
+        return cls.objects.bulk_create(
+            [cls(competition=competition, archer=archer) for archer in archers],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
     def __str__(self):
-        return f"{str(self.archer)} - {str(self.competition)}"
+        return f"{self.archer} - {self.competition}"
 
-    def __unicode__(self):
-        return f"{str(self.archer)} - {str(self.competition)}"
+    class Meta:
+        # Same layout as Membership: the unique constraint indexes
+        # (competition, archer), the reverse index serves the competitions of an archer.
+        constraints = [
+            models.UniqueConstraint(
+                fields=['competition', 'archer'],
+                name='competitionmembership_competition_archer_unique',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['archer', 'competition'], name='compmember_archer_comp_idx'),
+        ]
 
 class Arrow(BaseModel):
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     name = models.CharField(
         max_length=64,
         null=False,
@@ -2445,7 +2497,7 @@ class Arrow(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the arrow's name.
     # This allows for easy identification of the arrow in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     # info is a TextField that stores additional information about the arrow.
     # It is not required and can be blank.
@@ -2511,16 +2563,13 @@ class Arrow(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class ArrowType(BaseModel):
     """
     Model representing an arrow type used in archery.
     """
 
     # id is a UUID field that serves as the primary key for the ArrowType model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the arrow type, which describes the type of arrow.
     name = models.CharField(
         max_length=64,
@@ -2538,7 +2587,7 @@ class ArrowType(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the arrow type's name.
     # This allows for easy identification of the arrow type in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     # info is a text field for additional information about the arrow type.
     # It is not required and can be blank.
@@ -2578,8 +2627,6 @@ class ArrowType(BaseModel):
        verbose_name_plural = _("Arrow Types")
     def __str__(self):
        return self.name
-    def __unicode__(self):
-       return self.name
 
 class ArrowTypeMembership(BaseModel):
     """
@@ -2587,7 +2634,7 @@ class ArrowTypeMembership(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the ArrowTypeMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # arrow is a foreign key to the Arrow model, indicating which arrow is being associated with the type.
     arrow = models.ForeignKey(
         Arrow,
@@ -2632,20 +2679,14 @@ class ArrowTypeMembership(BaseModel):
         Returns a string representation of the ArrowTypeMembership instance.
         This representation includes the arrow and arrow type names.
         """
-        return f"{str(self.arrow)} - {str(self.arrowtype)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the ArrowTypeMembership instance.
-        This representation includes the arrow and arrow type names.
-        """
-        return f"{str(self.arrow)} - {str(self.arrowtype)}"
+        return f"{self.arrow} - {self.arrowtype}"
 
 class Fletching(BaseModel):
     """
     Model representing a fletching used in archery arrows.
     """
     # id is a UUID field that serves as the primary key for the Fletching model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the fletching, which is a part of the arrow that stabilizes its flight.
     name = models.CharField(
         max_length=64,
@@ -2663,7 +2704,7 @@ class Fletching(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the fletching's name.
     # This allows for easy identification of the fletching in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
     
     # arrow is a many-to-many relationship with the Arrow model, allowing multiple arrows to be associated with a fletching.
     arrow = models.ManyToManyField(
@@ -2821,16 +2862,13 @@ class Fletching(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class ArrowFletching(BaseModel):
     """
     Model representing the relationship between an arrow and its fletching.
     """
 
     # id is a UUID field that serves as the primary key for the ArrowFletching model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # arrow is a foreign key to the Arrow model, indicating which arrow is being fletched.
     arrow = models.ForeignKey(
         Arrow,
@@ -2877,14 +2915,7 @@ class ArrowFletching(BaseModel):
         Returns a string representation of the ArrowFletching instance.
         This representation includes the arrow and fletching names.
         """
-        return f"{str(self.arrow)} - {str(self.fletching)}"
-
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the ArrowFletching instance.
-        This representation includes the arrow and fletching names.
-        """
-        return f"{str(self.arrow)} - {str(self.fletching)}"
+        return f"{self.arrow} - {self.fletching}"
 
 class BowSight(BaseModel):
     """
@@ -2892,7 +2923,7 @@ class BowSight(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the BowSight model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the bow sight.
     name = models.CharField(
         max_length=64,
@@ -2910,7 +2941,7 @@ class BowSight(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the bow sight's name.
     # This allows for easy identification of the bow sight in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     # bowtype is a foreign key to the BowType model, indicating which type of bow the sight is compatible with.
     bowtype = models.ForeignKey(
@@ -3019,16 +3050,13 @@ class BowSight(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class BowSightArcher(BaseModel):
     """
     Model representing the relationship between an archer and a bow sight.
     """
 
     # id is a UUID field that serves as the primary key for the BowSightArcher model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bowsight is a foreign key to the BowSight model, indicating which bow sight is being used by the archer.
     bowsight = models.ForeignKey(
         BowSight,
@@ -3073,13 +3101,7 @@ class BowSightArcher(BaseModel):
         Returns a string representation of the BowSightArcher instance.
         This representation includes the archer and bow sight names.
         """
-        return f"{str(self.archer)} - {str(self.bowsight)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BowSightArcher instance.
-        This representation includes the archer and bow sight names.
-        """
-        return f"{str(self.archer)} - {str(self.bowsight)}"
+        return f"{self.archer} - {self.bowsight}"
 
 class Round(BaseModel):
     """
@@ -3087,7 +3109,7 @@ class Round(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the Round model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the round, which describes the round type.
     name = models.CharField(
         max_length=64,
@@ -3105,7 +3127,7 @@ class Round(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the round's name.
     # This allows for easy identification of the round in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     # targetface is a foreign key to the TargetFace model, indicating which target face is used in this round.
     targetface = models.ForeignKey(
@@ -3163,16 +3185,13 @@ class Round(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class RoundMembership(BaseModel):
     """
     Model representing the relationship between a round and an archer.
     """
 
     # id is a UUID field that serves as the primary key for the RoundMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # round is a foreign key to the Round model, indicating which round is being participated in.
     round = models.ForeignKey(
         Round,
@@ -3218,13 +3237,7 @@ class RoundMembership(BaseModel):
         Returns a string representation of the RoundMembership instance.
         This representation includes the archer and round names.
         """
-        return f"{str(self.archer)} - {str(self.round)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the RoundMembership instance.
-        This representation includes the archer and round names.
-        """
-        return f"{str(self.archer)} - {str(self.round)}"
+        return f"{self.archer} - {self.round}"
 
 class Distance(BaseModel):
     """
@@ -3232,7 +3245,7 @@ class Distance(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the Distance model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the distance, which describes the distance type.
     name = models.CharField(
         max_length=64,
@@ -3250,7 +3263,7 @@ class Distance(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the distance's name.
     # This allows for easy identification of the distance in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     # info is a text field for additional information about the distance.
     # It is not required and can be blank.
@@ -3289,9 +3302,6 @@ class Distance(BaseModel):
 
     def __str__(self):
        return self.name
-
-    def __unicode__(self):
-       return self.name
     
 class RoundDistance(BaseModel):
     """
@@ -3299,7 +3309,7 @@ class RoundDistance(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the RoundDistance model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # round is a foreign key to the Round model, indicating which round is being associated with the distance.
     round = models.ForeignKey(
         Round,
@@ -3347,14 +3357,7 @@ class RoundDistance(BaseModel):
         Returns a string representation of the RoundDistance instance.
         This representation includes the round and distance names.
         """
-        return f"{str(self.round)} - {str(self.distance)}"
-
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the RoundDistance instance.
-        This representation includes the round and distance names.
-        """
-        return f"{str(self.round)} - {str(self.distance)}"
+        return f"{self.round} - {self.distance}"
 
 class Range(BaseModel):
     """
@@ -3362,7 +3365,7 @@ class Range(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the Range model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the range, which describes the range type.
     name = models.CharField(
         max_length=64,
@@ -3380,7 +3383,7 @@ class Range(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the range's name.
     # This allows for easy identification of the range in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     # info is a text field for additional information about the range.
     # It is not required and can be blank.
@@ -3419,9 +3422,6 @@ class Range(BaseModel):
 
     def __str__(self):
        return self.name
-
-    def __unicode__(self):
-       return self.name
     
 class RangeRound(BaseModel):
     """
@@ -3429,7 +3429,7 @@ class RangeRound(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the RangeRound model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # range is a foreign key to the Range model, indicating which range is being associated with the round.
     range = models.ForeignKey(
         Range,
@@ -3473,12 +3473,7 @@ class RangeRound(BaseModel):
         """ Returns a string representation of the RangeRound instance.
         This representation includes the range and round names.
         """
-        return f"{str(self.range)} - {str(self.round)}"
-    def __unicode__(self):
-        """ Returns a unicode representation of the RangeRound instance.
-        This representation includes the range and round names.
-        """
-        return f"{str(self.range)} - {str(self.round)}"
+        return f"{self.range} - {self.round}"
 
 class Score(BaseModel):
     """
@@ -3486,7 +3481,7 @@ class Score(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the Score model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # archer is a foreign key to the Archer model, indicating which archer scored the points.
     archer = models.ForeignKey(
         Archer,
@@ -3528,9 +3523,6 @@ class Score(BaseModel):
     def __str__(self):
        return f"{self.archer} - {self.round} - {self.score}"
 
-    def __unicode__(self):
-       return f"{self.archer} - {self.round} - {self.score}"
-
 class ScoreMembership(BaseModel):
     """
     Model representing the relationship between an archer and a score.
@@ -3538,7 +3530,7 @@ class ScoreMembership(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the ScoreMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # score is a foreign key to the Score model, indicating which score is being associated with the archer.
     score = models.ForeignKey(
         Score,
@@ -3585,14 +3577,7 @@ class ScoreMembership(BaseModel):
         Returns a string representation of the ScoreMembership instance.
         This representation includes the archer and score details.
         """
-        return f"{str(self.archer)} - {str(self.score)}"
-
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the ScoreMembership instance.
-        This representation includes the archer and score details.
-        """
-        return f"{str(self.archer)} - {str(self.score)}"
+        return f"{self.archer} - {self.score}"
 
 class CompetitionScore(BaseModel):
     """
@@ -3600,7 +3585,7 @@ class CompetitionScore(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the CompetitionScore model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # competition is a foreign key to the Competition model, indicating which competition the score belongs to.
     competition = models.ForeignKey(
         Competition,
@@ -3635,16 +3620,13 @@ class CompetitionScore(BaseModel):
     def __str__(self):
        return f"{self.competition} - {self.archer} - {self.score}"
 
-    def __unicode__(self):
-       return f"{self.competition} - {self.archer} - {self.score}"
-
 class ClubChampionship(BaseModel):
     """
     Model representing a club championship, which is a competition within a club.
     """
 
     # id is a UUID field that serves as the primary key for the ClubChampionship model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the club championship, which describes the championship type.
     name = models.CharField(
         max_length=64,
@@ -3662,7 +3644,7 @@ class ClubChampionship(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the club championship's name.
     # This allows for easy identification of the club championship in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     # info is a text field for additional information about the club championship.
     # It is not required and can be blank.
@@ -3702,16 +3684,13 @@ class ClubChampionship(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class ClubChampionshipMembership(BaseModel):
     """
     Model representing the relationship between a club championship and an archer.
     """
 
     # id is a UUID field that serves as the primary key for the ClubChampionshipMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # clubchampionship is a foreign key to the ClubChampionship model, indicating which championship is being participated in.
     clubchampionship = models.ForeignKey(
         ClubChampionship,
@@ -3756,13 +3735,7 @@ class ClubChampionshipMembership(BaseModel):
         Returns a string representation of the ClubChampionshipMembership instance.
         This representation includes the archer and club championship names.
         """
-        return f"{str(self.archer)} - {str(self.clubchampionship)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the ClubChampionshipMembership instance.
-        This representation includes the archer and club championship names.
-        """
-        return f"{str(self.archer)} - {str(self.clubchampionship)}"
+        return f"{self.archer} - {self.clubchampionship}"
 
 class ClubChampionshipScore(BaseModel):
     """
@@ -3770,7 +3743,7 @@ class ClubChampionshipScore(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the ClubChampionshipScore model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # clubchampionship is a foreign key to the ClubChampionship model, indicating which championship the score belongs to.
     clubchampionship = models.ForeignKey(
         ClubChampionship,
@@ -3802,8 +3775,6 @@ class ClubChampionshipScore(BaseModel):
        verbose_name_plural = _("Club Championship Scores")
     def __str__(self):
        return f"{self.clubchampionship} - {self.archer} - {self.score}"
-    def __unicode__(self):
-       return f"{self.clubchampionship} - {self.archer} - {self.score}"
 
 class PersonalBest(BaseModel):
     """
@@ -3811,7 +3782,7 @@ class PersonalBest(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the PersonalBest model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # archer is a foreign key to the Archer model, indicating which archer achieved the personal best.
     archer = models.ForeignKey(
         Archer,
@@ -3845,8 +3816,6 @@ class PersonalBest(BaseModel):
 
     def __str__(self):
        return f"{self.archer} - {self.competition} - {self.score}"
-    def __unicode__(self):
-       return f"{self.archer} - {self.competition} - {self.score}"
 
 class PersonalBestMembership(BaseModel):
     """
@@ -3854,7 +3823,7 @@ class PersonalBestMembership(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the PersonalBestMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
 
     # personalbest is a foreign key to the PersonalBest model, indicating which personal best is being associated with the archer.
     personalbest = models.ForeignKey(
@@ -3881,7 +3850,7 @@ class BestOfClub(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the BestOfClub model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # archer is a foreign key to the Archer model, indicating which archer achieved the best score.
     archer = models.ForeignKey(
         Archer,
@@ -3905,15 +3874,13 @@ class BestOfClub(BaseModel):
        verbose_name_plural = _("Best of Clubs")
     def __str__(self):
        return f"{self.archer} - {self.score}"
-    def __unicode__(self):
-       return f"{self.archer} - {self.score}"
 class BestOfClubMembership(BaseModel):
     """
     Model representing the relationship between a best of club and an archer.
     """
 
     # id is a UUID field that serves as the primary key for the BestOfClubMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bestofclub is a foreign key to the BestOfClub model, indicating which best of club is being associated with the archer.
     bestofclub = models.ForeignKey(
         BestOfClub,
@@ -3958,13 +3925,7 @@ class BestOfClubMembership(BaseModel):
         Returns a string representation of the BestOfClubMembership instance.
         This representation includes the archer and best of club details.
         """
-        return f"{str(self.archer)} - {str(self.bestofclub)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BestOfClubMembership instance.
-        This representation includes the archer and best of club details.
-        """
-        return f"{str(self.archer)} - {str(self.bestofclub)}"
+        return f"{self.archer} - {self.bestofclub}"
 
 class Accessory(BaseModel):
     """
@@ -3972,7 +3933,7 @@ class Accessory(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the Accessory model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the accessory, which describes the accessory type.
     name = models.CharField(
         max_length=64,
@@ -3990,7 +3951,7 @@ class Accessory(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the accessory's name.
     # This allows for easy identification of the accessory in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     # info is a text field for additional information about the accessory.
     # It is not required and can be blank.
@@ -4030,9 +3991,6 @@ class Accessory(BaseModel):
     def __str__(self):
        return self.name
 
-    def __unicode__(self):
-       return self.name
-
 class ArcherAccessory(BaseModel):
     """
     Model representing the relationship between an archer and an accessory.
@@ -4040,7 +3998,7 @@ class ArcherAccessory(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the ArcherAccessory model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # accessory is a foreign key to the Accessory model, indicating which accessory is being used by the archer.
     accessory = models.ForeignKey(
         Accessory,
@@ -4087,13 +4045,7 @@ class ArcherAccessory(BaseModel):
         Returns a string representation of the ArcherAccessory instance.
         This representation includes the archer and accessory names.
         """
-        return f"{str(self.archer)} - {str(self.accessory)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the ArcherAccessory instance.
-        This representation includes the archer and accessory names.
-        """
-        return f"{str(self.archer)} - {str(self.accessory)}"
+        return f"{self.archer} - {self.accessory}"
 
 class ArcherAccessoryMembership(BaseModel):
     """
@@ -4102,7 +4054,7 @@ class ArcherAccessoryMembership(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the ArcherAccessoryMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # archeraccessory is a foreign key to the ArcherAccessory model, indicating which accessory is being associated with the archer.
     archeraccessory = models.ForeignKey(
         ArcherAccessory,
@@ -4149,20 +4101,14 @@ class ArcherAccessoryMembership(BaseModel):
         Returns a string representation of the ArcherAccessoryMembership instance.
         This representation includes the archer and accessory names.
         """
-        return f"{str(self.archer)} - {str(self.archeraccessory)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the ArcherAccessoryMembership instance.
-        This representation includes the archer and accessory names.
-        """
-        return f"{str(self.archer)} - {str(self.archeraccessory)}"
+        return f"{self.archer} - {self.archeraccessory}"
 class BowSightAccessory(BaseModel):
     """
     Model representing the relationship between a bow sight and an accessory.
     This model is used to track which accessories are associated with which bow sights.
     """
     # id is a UUID field that serves as the primary key for the BowSightAccessory model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bowsight is a foreign key to the BowSight model, indicating which bow sight is being associated with the accessory.
     bowsight = models.ForeignKey(
         BowSight,
@@ -4209,13 +4155,7 @@ class BowSightAccessory(BaseModel):
         Returns a string representation of the BowSightAccessory instance.
         This representation includes the bow sight and accessory names.
         """
-        return f"{str(self.bowsight)} - {str(self.accessory)}"
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BowSightAccessory instance.
-        This representation includes the bow sight and accessory names.
-        """
-        return f"{str(self.bowsight)} - {str(self.accessory)}"
+        return f"{self.bowsight} - {self.accessory}"
 class BowSightAccessoryMembership(BaseModel):
     """
     Model representing the relationship between a bow sight accessory and an archer.
@@ -4223,7 +4163,7 @@ class BowSightAccessoryMembership(BaseModel):
     model is used to track which archers are associated with which bow sight accessories.
     """
     # id is a UUID field that serves as the primary key for the BowSightAccessoryMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bowsightaccessory is a foreign key to the BowSightAccessory model, indicating which bow sight accessory is being associated with the archer.
     bowsightaccessory = models.ForeignKey(
         BowSightAccessory,
@@ -4270,14 +4210,7 @@ class BowSightAccessoryMembership(BaseModel):
         Returns a string representation of the BowSightAccessoryMembership instance.
         This representation includes the archer and bow sight accessory names.
         """
-        return f"{str(self.archer)} - {str(self.bowsightaccessory)}"
-
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BowSightAccessoryMembership instance.
-        This representation includes the archer and bow sight accessory names.
-        """
-        return f"{str(self.archer)} - {str(self.bowsightaccessory)}"
+        return f"{self.archer} - {self.bowsightaccessory}"
 
 class Bow(BaseModel):
     """
@@ -4285,7 +4218,7 @@ class Bow(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the Bow model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # name is a required field for the bow, which describes the bow type.
     name = models.CharField(
         max_length=64,
@@ -4303,7 +4236,7 @@ class Bow(BaseModel):
     # The slug is generated from the name field, ensuring that it is always based on the bow's name.
     # This allows for easy identification of the bow in URLs and other contexts.
     # The slug field is editable, allowing users to change it if needed.
-    slug = AutoSlugField(populate_from='name',editable=True)
+    slug = AutoSlugField(populate_from='name',editable=True,allow_duplicates=True)
 
     # info is a text field for additional information about the bow.
     # It is not required and can be blank.
@@ -4340,8 +4273,6 @@ class Bow(BaseModel):
        verbose_name_plural = _("Bows")
     def __str__(self):
        return self.name
-    def __unicode__(self):
-       return self.name
 class BowMembership(BaseModel):
     """
     Model representing the relationship between a bow and an archer.
@@ -4349,7 +4280,7 @@ class BowMembership(BaseModel):
     model is used to track which bows are used by which archers.
     """
     # id is a UUID field that serves as the primary key for the BowMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bow is a foreign key to the Bow model, indicating which bow is being used by the archer.
     bow = models.ForeignKey(
         Bow,
@@ -4398,14 +4329,7 @@ class BowMembership(BaseModel):
         Returns a string representation of the BowMembership instance.
         This representation includes the archer and bow names.
         """
-        return f"{str(self.archer)} - {str(self.bow)}"
-
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BowMembership instance.
-        This representation includes the archer and bow names.
-        """
-        return f"{str(self.archer)} - {str(self.bow)}"
+        return f"{self.archer} - {self.bow}"
 
 class BowAccessory(BaseModel):
     """
@@ -4414,7 +4338,7 @@ class BowAccessory(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the BowAccessory model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bow is a foreign key to the Bow model, indicating which bow is being associated with the accessory.
     bow = models.ForeignKey(
         Bow,
@@ -4461,14 +4385,7 @@ class BowAccessory(BaseModel):
         Returns a string representation of the BowAccessory instance.
         This representation includes the bow and accessory names.
         """
-        return f"{str(self.bow)} - {str(self.accessory)}"
-
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BowAccessory instance.
-        This representation includes the bow and accessory names.
-        """
-        return f"{str(self.bow)} - {str(self.accessory)}"
+        return f"{self.bow} - {self.accessory}"
 
 class BowAccessoryMembership(BaseModel):
     """
@@ -4477,7 +4394,7 @@ class BowAccessoryMembership(BaseModel):
     """
 
     # id is a UUID field that serves as the primary key for the BowAccessoryMembership model.
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuidv7, editable=False)
     # bowaccessory is a foreign key to the BowAccessory model, indicating which bow accessory is being associated with the archer.
     bowaccessory = models.ForeignKey(
         BowAccessory,
@@ -4524,12 +4441,5 @@ class BowAccessoryMembership(BaseModel):
         Returns a string representation of the BowAccessoryMembership instance.
         This representation includes the archer and bow accessory names.
         """
-        return f"{str(self.archer)} - {str(self.bowaccessory)}"
-
-    def __unicode__(self):
-        """
-        Returns a unicode representation of the BowAccessoryMembership instance.
-        This representation includes the archer and bow accessory names.
-        """
-        return f"{str(self.archer)} - {str(self.bowaccessory)}"
+        return f"{self.archer} - {self.bowaccessory}"
 
@@ -93,6 +93,13 @@ class ClubCreateSerializer(serializers.ModelSerializer):
     id = serializers.UUIDField(read_only=True)
     memberships = MembershipSerializer(many=True, required=False)
 
+    def validate_memberships(self, value):
+        # (club, archer) is unique, a repeated archer would fail on insert
+        archers = [membership['archer'] for membership in value]
+        if len(set(archers)) != len(archers):
+            raise serializers.ValidationError("An archer can only be listed once.")
+        return value
+
     def update(self, instance, validated_data):
         membership_data = validated_data.pop('memberships')
 
@@ -101,8 +108,13 @@ class ClubCreateSerializer(serializers.ModelSerializer):
 
             if membership_data is not None:
                 instance.memberships.all().delete()
-                for membership in membership_data:
-                    Membership.objects.create(club=instance, **membership)
+                Membership.objects.bulk_create(
+                    [
+                        Membership(club=instance, **membership)
+                        for membership in membership_data
+                    ],
+                    batch_size=500,
+                )
 
         return instance
 
@@ -111,8 +123,10 @@ class ClubCreateSerializer(serializers.ModelSerializer):
 
         with transaction.atomic():
             club = Club.objects.create(**validated_data)
-            for membership in membership_data:
-                Membership.objects.create(club=club, **membership)
+            Membership.objects.bulk_create(
+                [Membership(club=club, **membership) for membership in membership_data],
+                batch_size=500,
+            )
 
         return club
 
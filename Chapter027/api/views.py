@@ -50,7 +50,7 @@ class ArcherDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
         return super().get_permissions()
 
 class ClubViewSet(viewsets.ModelViewSet):
-    queryset = Club.objects.prefetch_related('memberships__archer').order_by('name')
+    queryset = Club.objects.with_members().order_by('name')
     serializer_class = ClubSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = None